@@ -11,12 +11,14 @@ Environment Variables:
     AWS_ACCESS_KEY_ID: AWS access key
     AWS_SECRET_ACCESS_KEY: AWS secret key
     AWS_DEFAULT_REGION: AWS region (optional, defaults to us-east-1)
+    AWS_S3_BUCKET: Bucket name to check for existence (optional)
 """
 
 from __future__ import annotations
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 def main() -> int:
@@ -43,17 +45,47 @@ def main() -> int:
     print("\n=== Full AWS Connector ===")
     full_connector = AWSConnectorFull()
 
-    # List S3 buckets
+    # List S3 buckets, resolving each bucket's region concurrently
     print("\nS3 Buckets:")
     try:
-        buckets = full_connector.list_buckets()
-        for bucket in buckets[:5]:  # Show first 5
-            print(f"  - {bucket['Name']}")
-        if len(buckets) > 5:
-            print(f"  ... and {len(buckets) - 5} more")
+        from botocore.config import Config
+
+        buckets = full_connector.list_s3_buckets()
+        names = list(buckets)
+
+        # One pooled client shared by all worker threads (boto3 clients are thread-safe)
+        s3 = full_connector.get_aws_client(
+            "s3",
+            config=Config(max_pool_connections=50, retries={"max_attempts": 5, "mode": "standard"}),
+        )
+
+        regions: dict[str, str] = {}
+        if names:
+            with ThreadPoolExecutor(max_workers=min(32, len(names))) as executor:
+                futures = {executor.submit(s3.get_bucket_location, Bucket=name): name for name in names}
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        regions[name] = future.result().get("LocationConstraint") or "us-east-1"
+                    except Exception as e:
+                        regions[name] = f"unknown ({e})"
+
+        for name in names[:5]:  # Show first 5
+            print(f"  - {name} ({regions.get(name, 'unknown')})")
+        if len(names) > 5:
+            print(f"  ... and {len(names) - 5} more")
     except Exception as e:
         print(f"  Could not list buckets: {e}")
 
+    # Check a single bucket with HeadBucket instead of scanning list_s3_buckets()
+    bucket_name = os.getenv("AWS_S3_BUCKET")
+    if bucket_name:
+        try:
+            exists = full_connector.bucket_exists(bucket_name)
+            print(f"\nBucket '{bucket_name}' exists: {exists}")
+        except Exception as e:
+            print(f"\nCould not check bucket '{bucket_name}': {e}")
+
     # List organization accounts (if using Organizations)
     print("\nOrganization Accounts:")
     try:
@@ -16,6 +16,8 @@ from __future__ import annotations
 
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 def main() -> int:
@@ -40,31 +42,55 @@ def main() -> int:
 
     # Full connector with all operations
     print("\n=== Full Google Connector ===")
-    full_connector = GoogleConnectorFull()
+
+    # googleapiclient service objects wrap a non-thread-safe httplib2.Http,
+    # so each worker thread gets its own connector. Parsed credentials are
+    # cached per service account, so the extra connector is cheap.
+    local = threading.local()
+
+    def thread_connector() -> GoogleConnectorFull:
+        if not hasattr(local, "connector"):
+            local.connector = GoogleConnectorFull()
+        return local.connector
+
+    # Projects and workspace users are independent, so fetch them concurrently
+    tasks = {"projects": lambda: thread_connector().list_projects()}
+    if os.getenv("GOOGLE_DOMAIN"):
+        tasks["users"] = lambda: thread_connector().list_users()
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = {executor.submit(fn): name for name, fn in tasks.items()}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                results[name] = e
 
     # List projects
     print("\nCloud Projects:")
-    try:
-        projects = full_connector.list_projects()
+    projects = results["projects"]
+    if isinstance(projects, Exception):
+        print(f"  Could not list projects: {projects}")
+    else:
         for project in projects[:5]:
             print(f"  - {project.get('name', 'Unnamed')} ({project.get('projectId')})")
         if len(projects) > 5:
             print(f"  ... and {len(projects) - 5} more")
-    except Exception as e:
-        print(f"  Could not list projects: {e}")
 
     # List workspace users (if domain configured)
-    if os.getenv("GOOGLE_DOMAIN"):
+    if "users" in results:
         print("\nWorkspace Users:")
-        try:
-            users = full_connector.list_users()
+        users = results["users"]
+        if isinstance(users, Exception):
+            print(f"  Could not list users: {users}")
+        else:
             for user in users[:5]:
                 email = user.get("primaryEmail", "Unknown")
                 print(f"  - {email}")
             if len(users) > 5:
                 print(f"  ... and {len(users) - 5} more")
-        except Exception as e:
-            print(f"  Could not list users: {e}")
 
     print("\nDone!")
     return 0
@@ -14,9 +14,55 @@ Environment Variables:
 from __future__ import annotations
 
 import os
+import random
 import sys
 import time
 
+PENDING_STATUSES = ("PENDING", "IN_PROGRESS")
+
+
+def poll_until_done(
+    task_id: str,
+    initial: float = 1.0,
+    factor: float = 1.5,
+    cap: float = 15.0,
+    jitter: float = 0.2,
+):
+    """Poll a text-to-3D task with capped exponential backoff.
+
+    Short jobs are picked up quickly while long jobs make progressively
+    fewer status calls. Rate-limit and server errors jump straight to the
+    capped delay before the next attempt.
+
+    Args:
+        task_id: Meshy task ID to poll.
+        initial: First delay in seconds.
+        factor: Multiplier applied to the delay after each poll.
+        cap: Maximum delay in seconds.
+        jitter: Fractional +/- jitter applied to each sleep.
+
+    Returns:
+        The final Text3DResult once the task leaves a pending state.
+    """
+    from tenacity import RetryError
+
+    from vendor_connectors.meshy import RateLimitError, text3d
+
+    delay = initial
+    while True:
+        try:
+            result = text3d.get(task_id)
+        except (RateLimitError, RetryError) as e:
+            print(f"Rate limited or server error ({e}), backing off {cap:.0f}s...")
+            delay = cap
+        else:
+            if result.status not in PENDING_STATUSES:
+                return result
+            print(f"Status: {result.status}...")
+
+        time.sleep(delay * (1 + random.uniform(-jitter, jitter)))
+        delay = min(cap, delay * factor)
+
 
 def main() -> int:
     """Demonstrate Meshy AI 3D generation."""
@@ -38,20 +84,16 @@ def main() -> int:
 
     try:
         # Start the generation (preview mode for faster results)
-        result = text3d.generate(
+        task_id = text3d.generate(
             prompt=prompt,
             art_style="realistic",
-            mode="preview",  # Use 'refine' for higher quality
+            wait=False,
         )
 
-        print(f"Task ID: {result.id}")
-        print(f"Status: {result.status}")
+        print(f"Task ID: {task_id}")
 
-        # Poll for completion
-        while result.status in ("PENDING", "IN_PROGRESS"):
-            time.sleep(5)
-            result = text3d.get(result.id)
-            print(f"Status: {result.status}...")
+        # Poll for completion with adaptive backoff
+        result = poll_until_done(task_id)
 
         if result.status == "SUCCEEDED":
             print("\n=== Generation Complete ===")
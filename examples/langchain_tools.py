@@ -11,14 +11,44 @@ Requirements:
 Environment Variables:
     MESHY_API_KEY: Your Meshy API key
     ANTHROPIC_API_KEY: Your Anthropic API key (for Claude)
+    MESHY_MAX_CONCURRENCY: Max tool calls in flight at once (default: 5)
+    LANGCHAIN_TRACING_V2: Optional; set to "true" to trace runs in LangSmith
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
 import sys
 
 
+async def stream_agent(agent, query: str, max_concurrency: int) -> None:
+    """Print agent messages as they arrive instead of after the run finishes.
+
+    Each message is printed and dropped as it is streamed, so long tool outputs
+    are never accumulated in memory. ``max_concurrency`` caps how many of a
+    turn's tool calls are in flight at once.
+    """
+    last_role = None
+    async for chunk, _metadata in agent.astream(
+        {"messages": [("user", query)]},
+        config={"max_concurrency": max_concurrency},
+        stream_mode="messages",
+    ):
+        content = chunk.content
+        if isinstance(content, list):
+            # Anthropic chunks carry content blocks; only text blocks are printable.
+            content = "".join(block.get("text", "") for block in content if isinstance(block, dict))
+        if not content:
+            continue
+        role = chunk.__class__.__name__.replace("MessageChunk", "").replace("Message", "")
+        if role != last_role:
+            print(f"\n[{role}]: ", end="")
+            last_role = role
+        print(content[:500], end="", flush=True)
+    print()
+
+
 def main() -> int:
     """Demonstrate LangChain integration with Meshy tools."""
     # Check for required environment variables
@@ -42,6 +72,10 @@ def main() -> int:
         print("Install with: pip install vendor-connectors[meshy,langchain] langchain-anthropic langgraph")
         return 1
 
+    # If LangSmith tracing is on, upload traces from a background thread rather
+    # than blocking each agent step on the export.
+    os.environ.setdefault("LANGCHAIN_CALLBACKS_BACKGROUND", "true")
+
     print("=== LangChain Agent with Meshy Tools ===\n")
 
     # Get Meshy tools for LangChain
@@ -60,16 +94,8 @@ def main() -> int:
     print("Running agent (this may take a minute)...\n")
 
     try:
-        result = agent.invoke({"messages": [("user", query)]})
-
-        # Print the response
-        for message in result["messages"]:
-            if hasattr(message, "content") and message.content:
-                role = message.__class__.__name__.replace("Message", "")
-                print(f"[{role}]: {message.content[:500]}...")
-                if len(message.content) > 500:
-                    print("  (truncated)")
-
+        max_concurrency = int(os.getenv("MESHY_MAX_CONCURRENCY", "5"))
+        asyncio.run(stream_agent(agent, query, max_concurrency))
     except Exception as e:
         print(f"Error running agent: {e}")
         return 1
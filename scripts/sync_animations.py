@@ -19,6 +19,7 @@ Requirements:
 import json
 import re
 import sys
+from collections import Counter
 from pathlib import Path
 
 import httpx
@@ -171,20 +172,14 @@ def generate_animations_py(animations: list[dict]) -> None:
     # Sort by ID
     animations = sorted(animations, key=lambda x: x.get("id", 0))
 
-    # Group by category
-    categories = {}
-    for anim in animations:
-        cat = anim.get("category", "Unknown")
-        if cat not in categories:
-            categories[cat] = []
-        categories[cat].append(anim)
-
     # Generate the Python code - formatted to match ruff output
     lines = [
         '"""Meshy Animation Library - Auto-generated from API docs."""',
         "",
         "from __future__ import annotations",
         "",
+        "import heapq",
+        "from collections import defaultdict",
         "from dataclasses import dataclass",
         "from enum import Enum",
         "",
@@ -192,7 +187,7 @@ def generate_animations_py(animations: list[dict]) -> None:
         "# Do not edit manually - run the script to update.",
         "",
         "",
-        "@dataclass",
+        "@dataclass(slots=True)",
         "class AnimationMeta:",
         '    """Metadata for a Meshy animation."""',
         "",
@@ -252,6 +247,15 @@ def generate_animations_py(animations: list[dict]) -> None:
     # Add helper functions - formatted to match ruff output
     lines.extend(
         [
+            "# Category and subcategory indexes, built once so lookups don't scan ANIMATIONS",
+            "_BY_CATEGORY: defaultdict[str, list[AnimationMeta]] = defaultdict(list)",
+            "_BY_SUBCATEGORY: defaultdict[str, list[AnimationMeta]] = defaultdict(list)",
+            "for _anim in ANIMATIONS.values():",
+            "    _BY_CATEGORY[_anim.category].append(_anim)",
+            "    _BY_SUBCATEGORY[_anim.subcategory].append(_anim)",
+            "del _anim",
+            "",
+            "",
             "# Curated animation sets for common game use cases",
             "",
             "",
@@ -274,35 +278,28 @@ def generate_animations_py(animations: list[dict]) -> None:
             "    EXPLORATION: list[int] = []",
             "",
             "",
+            "def _first_ids(index: dict[str, list[AnimationMeta]], *keys: str, limit: int = 10) -> list[int]:",
+            '    """Get the lowest animation IDs across the given index buckets."""',
+            "    return heapq.nsmallest(limit, (anim.id for key in keys for anim in index.get(key, ())))",
+            "",
+            "",
             "# Populate animation sets from available animations",
             "def _populate_animation_sets() -> None:",
             '    """Populate animation sets based on available animations."""',
-            "    all_ids = set(ANIMATIONS.keys())",
-            "",
             "    # Basic movement: Idle + Walking + Running",
-            "    GameAnimationSet.BASIC_MOVEMENT = [",
-            '        aid for aid in all_ids if ANIMATIONS[aid].subcategory in ("Idle", "Walking", "Running")',
-            "    ][:10]  # Limit to first 10",
+            '    GameAnimationSet.BASIC_MOVEMENT = _first_ids(_BY_SUBCATEGORY, "Idle", "Walking", "Running")',
             "",
             "    # Combat: Fighting category",
-            '    GameAnimationSet.COMBAT = [aid for aid in all_ids if ANIMATIONS[aid].category == "Fighting"][',
-            "        :10",
-            "    ]",
+            '    GameAnimationSet.COMBAT = _first_ids(_BY_CATEGORY, "Fighting")',
             "",
             "    # Social: Interacting subcategory",
-            "    GameAnimationSet.SOCIAL = [",
-            '        aid for aid in all_ids if ANIMATIONS[aid].subcategory == "Interacting"',
-            "    ][:10]",
+            '    GameAnimationSet.SOCIAL = _first_ids(_BY_SUBCATEGORY, "Interacting")',
             "",
             "    # Celebration: Dancing category",
-            "    GameAnimationSet.CELEBRATION = [",
-            '        aid for aid in all_ids if ANIMATIONS[aid].category == "Dancing"',
-            "    ][:10]",
+            '    GameAnimationSet.CELEBRATION = _first_ids(_BY_CATEGORY, "Dancing")',
             "",
             "    # Exploration: LookingAround + Idle",
-            "    GameAnimationSet.EXPLORATION = [",
-            '        aid for aid in all_ids if ANIMATIONS[aid].subcategory in ("LookingAround", "Idle")',
-            "    ][:10]",
+            '    GameAnimationSet.EXPLORATION = _first_ids(_BY_SUBCATEGORY, "LookingAround", "Idle")',
             "",
             "",
             "# Initialize sets on module load",
@@ -311,14 +308,14 @@ def generate_animations_py(animations: list[dict]) -> None:
             "",
             "def get_animations_by_category(category: AnimationCategory) -> list[AnimationMeta]:",
             '    """Get all animations in a category."""',
-            "    return [anim for anim in ANIMATIONS.values() if anim.category == category.value]",
+            "    return list(_BY_CATEGORY.get(category.value, ()))",
             "",
             "",
             "def get_animations_by_subcategory(",
             "    subcategory: AnimationSubcategory,",
             ") -> list[AnimationMeta]:",
             '    """Get all animations in a subcategory."""',
-            "    return [anim for anim in ANIMATIONS.values() if anim.subcategory == subcategory.value]",
+            "    return list(_BY_SUBCATEGORY.get(subcategory.value, ()))",
             "",
             "",
             "def get_animation(action_id: int) -> AnimationMeta:",
@@ -348,10 +345,7 @@ def display_summary(animations: list[dict]) -> None:
     table.add_column("Count", justify="right", style="green")
 
     # Group by category
-    categories: dict[str, int] = {}
-    for anim in animations:
-        cat = anim.get("category", "Unknown")
-        categories[cat] = categories.get(cat, 0) + 1
+    categories = Counter(anim.get("category", "Unknown") for anim in animations)
 
     for cat, count in sorted(categories.items()):
         table.add_row(cat, str(count))
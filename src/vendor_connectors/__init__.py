@@ -52,6 +52,9 @@ Usage:
 
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.2.0"
 
 # Core imports (always available)
@@ -68,17 +71,8 @@ from vendor_connectors.connectors import VendorConnectors
 from vendor_connectors.cursor import CursorConnector
 from vendor_connectors.zoom import ZoomConnector
 
-# Optional connectors - wrapped in try/except for graceful degradation
-# These require optional dependencies: pip install vendor-connectors[<extra>]
-
-# Anthropic connector (requires: pip install vendor-connectors[anthropic])
-try:
+if TYPE_CHECKING:
     from vendor_connectors.anthropic import AnthropicConnector
-except ImportError:
-    AnthropicConnector = None  # type: ignore[misc, assignment]
-
-# AWS connector (requires: pip install vendor-connectors[aws])
-try:
     from vendor_connectors.aws import (
         AWSConnector,
         AWSConnectorFull,
@@ -86,21 +80,7 @@ try:
         AWSS3Mixin,
         AWSSSOmixin,
     )
-except ImportError:
-    AWSConnector = None  # type: ignore[misc, assignment]
-    AWSConnectorFull = None  # type: ignore[misc, assignment]
-    AWSOrganizationsMixin = None  # type: ignore[misc, assignment]
-    AWSS3Mixin = None  # type: ignore[misc, assignment]
-    AWSSSOmixin = None  # type: ignore[misc, assignment]
-
-# GitHub connector (requires: pip install vendor-connectors[github])
-try:
     from vendor_connectors.github import GithubConnector
-except ImportError:
-    GithubConnector = None  # type: ignore[misc, assignment]
-
-# Google connector (requires: pip install vendor-connectors[google])
-try:
     from vendor_connectors.google import (
         GoogleBillingMixin,
         GoogleCloudMixin,
@@ -109,25 +89,57 @@ try:
         GoogleServicesMixin,
         GoogleWorkspaceMixin,
     )
-except ImportError:
-    GoogleConnector = None  # type: ignore[misc, assignment]
-    GoogleConnectorFull = None  # type: ignore[misc, assignment]
-    GoogleWorkspaceMixin = None  # type: ignore[misc, assignment]
-    GoogleCloudMixin = None  # type: ignore[misc, assignment]
-    GoogleBillingMixin = None  # type: ignore[misc, assignment]
-    GoogleServicesMixin = None  # type: ignore[misc, assignment]
-
-# Slack connector (requires: pip install vendor-connectors[slack])
-try:
     from vendor_connectors.slack import SlackConnector
-except ImportError:
-    SlackConnector = None  # type: ignore[misc, assignment]
-
-# Vault connector (requires: pip install vendor-connectors[vault])
-try:
     from vendor_connectors.vault import VaultConnector
-except ImportError:
-    VaultConnector = None  # type: ignore[misc, assignment]
+
+# Optional connectors - resolved lazily on first attribute access (PEP 562) so
+# that importing vendor_connectors does not pull in every vendor SDK.
+# These require optional dependencies: pip install vendor-connectors[<extra>]
+# and resolve to None when their extra is not installed.
+_LAZY_CONNECTORS: dict[str, str] = {
+    # Anthropic (requires: pip install vendor-connectors[anthropic])
+    "AnthropicConnector": "vendor_connectors.anthropic",
+    # AWS (requires: pip install vendor-connectors[aws])
+    "AWSConnector": "vendor_connectors.aws",
+    "AWSConnectorFull": "vendor_connectors.aws",
+    "AWSOrganizationsMixin": "vendor_connectors.aws",
+    "AWSS3Mixin": "vendor_connectors.aws",
+    "AWSSSOmixin": "vendor_connectors.aws",
+    # GitHub (requires: pip install vendor-connectors[github])
+    "GithubConnector": "vendor_connectors.github",
+    # Google (requires: pip install vendor-connectors[google])
+    "GoogleBillingMixin": "vendor_connectors.google",
+    "GoogleCloudMixin": "vendor_connectors.google",
+    "GoogleConnector": "vendor_connectors.google",
+    "GoogleConnectorFull": "vendor_connectors.google",
+    "GoogleServicesMixin": "vendor_connectors.google",
+    "GoogleWorkspaceMixin": "vendor_connectors.google",
+    # Slack (requires: pip install vendor-connectors[slack])
+    "SlackConnector": "vendor_connectors.slack",
+    # Vault (requires: pip install vendor-connectors[vault])
+    "VaultConnector": "vendor_connectors.vault",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import optional connectors on first access."""
+    module_path = _LAZY_CONNECTORS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        value = getattr(importlib.import_module(module_path), name)
+    except ImportError:
+        value = None
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily loaded connectors in dir() and tab completion."""
+    return sorted(set(globals()) | set(_LAZY_CONNECTORS))
+
 
 __all__ = [
     # Base class for all connectors
@@ -165,7 +177,9 @@ __all__ = [
     "get_connector",
     "get_connector_class",
     "get_connector_info",
+    "get_connectors_view",
     "list_connector_info",
+    "preload_connectors",
 ]
 
 # Registry - unified access to all connectors
@@ -173,6 +187,8 @@ from vendor_connectors.registry import (
     get_connector,
     get_connector_class,
     get_connector_info,
+    get_connectors_view,
     list_connector_info,
     list_connectors,
+    preload_connectors,
 )
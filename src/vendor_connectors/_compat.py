@@ -16,9 +16,18 @@ Usage:
 
 from __future__ import annotations
 
+import datetime
+import enum
+import functools
 import importlib
+import json
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
+
 # Mapping of package names to their extras
 PACKAGE_TO_EXTRA: dict[str, str] = {
     # Vendor connectors
@@ -45,31 +54,28 @@ PACKAGE_TO_EXTRA: dict[str, str] = {
     "uvicorn": "webhooks",
     "sqlite_vec": "vector",
     "sentence_transformers": "vector",
+    "orjson": "json",
 }
 
-# Cache for import checks
-_import_cache: dict[str, bool] = {}
-
 
+@functools.cache
 def is_available(package: str) -> bool:
     """Check if a package is available for import.
 
+    The package is imported once so broken installs report False; the result
+    is cached, so repeated framework probes cost a dict lookup.
+
     Args:
         package: Package name to check (e.g., "boto3", "langchain_core")
 
     Returns:
         True if package can be imported, False otherwise
     """
-    if package in _import_cache:
-        return _import_cache[package]
-
     try:
         importlib.import_module(package)
-        _import_cache[package] = True
-        return True
     except ImportError:
-        _import_cache[package] = False
         return False
+    return True
 
 
 def get_extra_for_package(package: str) -> str | None:
@@ -133,6 +139,55 @@ def require_any(*packages: str, extra: str) -> Any:
     )
 
 
+# === Serialization ===
+
+
+def _json_default(value: Any) -> Any:
+    """Render a value JSON has no type for: ISO 8601 for dates and times, else ``str()``."""
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return str(value)
+
+
+_compact_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=_json_default)
+_strict_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+# Route dates, times and dataclasses through the same default as the stdlib
+# encoder so output doesn't depend on whether orjson is installed.
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
+
+def dumps_compact(obj: Any, *, strict: bool = False) -> str:
+    """Serialize a tool result to compact JSON.
+
+    Uses orjson when installed (``vendor-connectors[json]``) and falls back to
+    a shared stdlib encoder; both produce the same text. Non-ASCII characters
+    are written as-is. Dates and times are rendered in ISO 8601, enums as
+    their value, and any other value that is not JSON-native with ``str()``.
+
+    Args:
+        obj: JSON-serializable object
+        strict: Raise TypeError for values that are not JSON-native instead
+            of converting them
+
+    Returns:
+        JSON string without indentation or extra whitespace
+
+    Raises:
+        TypeError: If ``strict`` and ``obj`` contains a non-JSON value
+    """
+    if orjson is not None:
+        default = None if strict else _json_default
+        return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS).decode()
+    return (_strict_encoder if strict else _compact_encoder).encode(obj)
+
+
 # === Framework Detection ===
 
 
@@ -3,12 +3,104 @@
 This module provides Pydantic-based helpers to define AI tool schemas
 that are compatible with the Vercel AI SDK and other modern AI frameworks.
 """
+
 from __future__ import annotations
 
-from typing import Any, Type
+import copy
+import functools
+import inspect
+import types
+import typing
+from typing import Any, Callable, Type
 
 from pydantic import BaseModel
 
+# Python annotation -> JSON schema "type". Keyed by both the type and its name
+# so string annotations that cannot be evaluated still resolve.
+_JSON_SCHEMA_TYPES: dict[Any, str] = {
+    key: schema_type
+    for py_type, schema_type in (
+        (str, "string"),
+        (int, "integer"),
+        (float, "number"),
+        (bool, "boolean"),
+        (list, "array"),
+        (tuple, "array"),
+        (set, "array"),
+        (dict, "object"),
+    )
+    for key in (py_type, py_type.__name__)
+}
+
+_UNION_TYPES = (typing.Union, types.UnionType)
+
+
+def get_json_schema_type(annotation: Any) -> str:
+    """Map a Python type annotation to a JSON schema type name.
+
+    ``Optional[X]`` and ``X | None`` resolve to the type of ``X``, and
+    generics such as ``list[str]`` resolve via their origin. Anything
+    unrecognised maps to ``"string"``.
+
+    Args:
+        annotation: A type, typing construct, or annotation string.
+
+    Returns:
+        JSON schema type name.
+    """
+    if isinstance(annotation, str):
+        parts = [part.strip() for part in annotation.split("|") if part.strip() != "None"]
+        annotation = parts[0].split("[", 1)[0] if len(parts) == 1 else None
+    else:
+        origin = typing.get_origin(annotation)
+        if origin in _UNION_TYPES:
+            args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+            return get_json_schema_type(args[0]) if len(args) == 1 else "string"
+        annotation = origin or annotation
+
+    return _JSON_SCHEMA_TYPES.get(annotation, "string")
+
+
+@functools.lru_cache(maxsize=256)
+def _signature_schema_types(func: Callable[..., Any]) -> dict[str, str]:
+    try:
+        hints = typing.get_type_hints(func)
+    except Exception:
+        hints = {}
+
+    return {
+        name: get_json_schema_type(hints.get(name, param.annotation))
+        for name, param in inspect.signature(func).parameters.items()
+        if param.annotation is not inspect.Parameter.empty
+    }
+
+
+def get_signature_schema_types(func: Callable[..., Any]) -> dict[str, str]:
+    """Resolve the JSON schema type of each annotated parameter of a function.
+
+    Postponed (string) annotations are evaluated where possible. Results are
+    cached per underlying function, so bound methods of different instances
+    share one entry.
+
+    Args:
+        func: Function or bound method.
+
+    Returns:
+        Mapping of parameter name to JSON schema type for annotated parameters.
+    """
+    return dict(_signature_schema_types(getattr(func, "__func__", func)))
+
+
+@functools.cache
+def _pydantic_schema(model: Type[BaseModel]) -> dict[str, Any]:
+    schema = model.model_json_schema()
+
+    # Remove top-level title and description
+    schema.pop("title", None)
+    schema.pop("description", None)
+
+    return schema
+
 
 def get_pydantic_schema(model: Type[BaseModel]) -> dict[str, Any]:
     """Generate a Vercel AI SDK-compatible JSON schema from a Pydantic model.
@@ -18,16 +110,13 @@ def get_pydantic_schema(model: Type[BaseModel]) -> dict[str, Any]:
     'description' fields are preserved as they are crucial for the AI to
     understand the tool's inputs.
 
+    The schema is generated once per model; each call returns a fresh copy
+    the caller may modify.
+
     Args:
         model: The Pydantic model class.
 
     Returns:
         A JSON schema dictionary.
     """
-    schema = model.model_json_schema()
-
-    # Remove top-level title and description
-    schema.pop("title", None)
-    schema.pop("description", None)
-
-    return schema
+    return copy.deepcopy(_pydantic_schema(model))
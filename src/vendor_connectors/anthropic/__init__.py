@@ -25,11 +25,20 @@ Reference: https://docs.anthropic.com/claude/reference
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from lifecyclelogging import Logging
 from pydantic import BaseModel, ConfigDict, Field
@@ -59,6 +68,7 @@ DEFAULT_API_URL = "https://api.anthropic.com"
 DEFAULT_API_VERSION = "2023-06-01"
 DEFAULT_TIMEOUT = 60.0
 DEFAULT_MAX_TOKENS = 4096
+DEFAULT_CACHE_SIZE = 256
 
 # Available Claude models
 # SOURCE OF TRUTH: https://docs.anthropic.com/en/docs/about-claude/models
@@ -186,6 +196,53 @@ class AgentExecutionResult:
     tokens_used: Optional[int] = None
 
 
+# =============================================================================
+# Helpers
+# =============================================================================
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize_text(text: str) -> str:
+    """Canonicalize prompt text: NFKC, case-folded, whitespace collapsed."""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text).casefold()).strip()
+
+
+# Stream events that carry an ``index`` into the message's content blocks
+_CONTENT_BLOCK_EVENTS = ("content_block_start", "content_block_delta", "content_block_stop")
+
+
+def _iter_sse_events(lines: Iterator[str]) -> Iterator[dict[str, Any]]:
+    """Parse server-sent event lines into JSON event payloads."""
+    for line in lines:
+        if line.startswith("data:"):
+            yield json.loads(line[5:].strip())
+
+
+def _normalize_prompts(body: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of a request body with its prompt text normalized."""
+    normalized = dict(body)
+    if isinstance(body.get("system"), str):
+        normalized["system"] = _normalize_text(body["system"])
+
+    messages = []
+    for message in body["messages"]:
+        content = message.get("content")
+        if isinstance(content, str):
+            content = _normalize_text(content)
+        elif isinstance(content, list):
+            content = [
+                {**block, "text": _normalize_text(block["text"])}
+                if isinstance(block, dict) and isinstance(block.get("text"), str)
+                else block
+                for block in content
+            ]
+        messages.append({**message, "content": content})
+    normalized["messages"] = messages
+
+    return normalized
+
+
 # =============================================================================
 # Connector
 # =============================================================================
@@ -201,6 +258,12 @@ class AnthropicConnector(VendorConnectorBase):
         api_key: Anthropic API key. Defaults to ANTHROPIC_API_KEY env var.
         api_version: API version string. Default "2023-06-01".
         timeout: Request timeout in seconds. Default 60s.
+        cache_ttl: Seconds to reuse responses to identical deterministic
+            (temperature=0) requests. Default 0 disables the cache.
+        cache_size: Maximum number of cached responses. Default 256.
+        cache_normalize: Treat prompts that differ only in case, Unicode form
+            or whitespace as identical when looking up cached responses.
+            Default False.
         logger: Optional logger instance.
         **kwargs: Additional DirectedInputsClass arguments.
 
@@ -222,11 +285,20 @@ class AnthropicConnector(VendorConnectorBase):
         api_key: Optional[str] = None,
         api_version: str = DEFAULT_API_VERSION,
         timeout: float = DEFAULT_TIMEOUT,
+        cache_ttl: float = 0.0,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        cache_normalize: bool = False,
         logger: Optional[Logging] = None,
         **kwargs,
     ):
         super().__init__(api_key=api_key, logger=logger, timeout=timeout, **kwargs)
 
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.cache_normalize = cache_normalize
+        self._response_cache: OrderedDict[str, tuple[float, Message]] = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+
         # Validate API key
         if not self._api_key:
             raise AnthropicError("ANTHROPIC_API_KEY is required. Set it in environment or pass to constructor.")
@@ -352,12 +424,178 @@ class AnthropicConnector(VendorConnectorBase):
         if metadata:
             body["metadata"] = metadata
 
+        cache_key = None
+        if self.cache_ttl > 0 and temperature == 0:
+            cache_key = self._response_cache_key(body, normalize=self.cache_normalize)
+        if cache_key:
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                self.logger.debug("Returning cached response")
+                return cached
+
         response = self.post("/v1/messages", json=body)
 
         if not response.is_success:
             self._handle_error(response)
 
-        return Message.model_validate(response.json())
+        message = Message.model_validate(response.json())
+        if cache_key:
+            self._store_cached_response(cache_key, message)
+        return message
+
+    def stream_message(
+        self,
+        model: str,
+        max_tokens: int,
+        messages: list[dict[str, Any]],
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        tools: Optional[list[dict[str, Any]]] = None,
+        tool_choice: Optional[dict[str, Any]] = None,
+        tool_handler: Optional[Callable[[str, dict[str, Any]], Any]] = None,
+        max_tool_concurrency: int = 5,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream a message from Claude as server-sent events.
+
+        Yields each API event (``message_start``, ``content_block_delta``,
+        ``message_stop``, ...) as it arrives. If ``tool_handler`` is given,
+        each ``tool_use`` block is handed to it in a worker thread as soon as
+        the block is complete, while the model keeps streaming. One
+        ``{"type": "tool_result", ...}`` event per tool call follows
+        ``message_stop``, in the order the model issued the calls.
+
+        Args:
+            model: Model ID (e.g., "claude-sonnet-4-20250514").
+            max_tokens: Maximum tokens to generate.
+            messages: List of message dicts with role and content.
+            system: Optional system prompt.
+            temperature: Sampling temperature (0-1).
+            tools: Tool definitions for function calling.
+            tool_choice: Tool choice configuration.
+            tool_handler: Optional callable run as ``tool_handler(name, input)``
+                for each tool call.
+            max_tool_concurrency: Maximum tool calls running at once.
+
+        Yields:
+            Event dicts from the API, then tool_result events.
+
+        Raises:
+            ValueError: If max_tool_concurrency is less than 1.
+            AnthropicError: If the API request fails or streams an error event.
+        """
+        if max_tool_concurrency < 1:
+            raise ValueError(f"max_tool_concurrency must be at least 1, got {max_tool_concurrency}")
+
+        self.logger.info(f"Streaming message with model: {model}")
+
+        body: dict[str, Any] = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "messages": messages,
+            "stream": True,
+        }
+        if system:
+            body["system"] = system
+        if temperature is not None:
+            body["temperature"] = temperature
+        if tools:
+            body["tools"] = tools
+        if tool_choice:
+            body["tool_choice"] = tool_choice
+
+        executor = ThreadPoolExecutor(max_workers=max_tool_concurrency) if tool_handler else None
+        pending: list[tuple[str, Future]] = []
+        tool_blocks: dict[int, dict[str, Any]] = {}
+
+        self._rate_limit()
+        try:
+            with self.client.stream(
+                "POST",
+                self._build_url("/v1/messages"),
+                headers=self._build_headers(),
+                json=body,
+            ) as response:
+                if not response.is_success:
+                    response.read()
+                    self._handle_error(response)
+
+                for event in _iter_sse_events(response.iter_lines()):
+                    event_type = event.get("type")
+                    if event_type == "ping":
+                        continue
+                    if event_type == "error":
+                        error = event.get("error", {})
+                        raise AnthropicAPIError(
+                            error.get("message", "Stream error"), error_type=error.get("type", "unknown")
+                        )
+
+                    if executor is not None and tool_handler is not None and event_type in _CONTENT_BLOCK_EVENTS:
+                        index = event["index"]
+                        if event_type == "content_block_start" and event["content_block"].get("type") == "tool_use":
+                            tool_blocks[index] = {**event["content_block"], "partial_json": ""}
+                        elif event_type == "content_block_delta" and index in tool_blocks:
+                            tool_blocks[index]["partial_json"] += event["delta"].get("partial_json", "")
+                        elif event_type == "content_block_stop" and index in tool_blocks:
+                            block = tool_blocks.pop(index)
+                            arguments = json.loads(block["partial_json"]) if block["partial_json"] else {}
+                            pending.append((block["id"], executor.submit(tool_handler, block["name"], arguments)))
+
+                    yield event
+
+            for tool_use_id, future in pending:
+                try:
+                    yield {"type": "tool_result", "tool_use_id": tool_use_id, "content": future.result()}
+                except Exception as e:
+                    yield {"type": "tool_result", "tool_use_id": tool_use_id, "content": str(e), "is_error": True}
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    # =========================================================================
+    # Response Cache
+    # =========================================================================
+
+    @staticmethod
+    def _response_cache_key(body: dict[str, Any], normalize: bool = False) -> str:
+        """Hash a request body into a cache key.
+
+        Args:
+            body: Request body.
+            normalize: Normalize the system prompt and message text first.
+
+        Returns:
+            Hex digest identifying the request.
+        """
+        if normalize:
+            body = _normalize_prompts(body)
+        canonical = json.dumps(body, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+    def _get_cached_response(self, key: str) -> Optional[Message]:
+        """Return a copy of a live cached response, evicting it if expired."""
+        with self._response_cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, message = entry
+            if expires_at <= time.monotonic():
+                del self._response_cache[key]
+                return None
+            self._response_cache.move_to_end(key)
+        return message.model_copy(deep=True)
+
+    def _store_cached_response(self, key: str, message: Message) -> None:
+        """Cache a response, evicting the least recently used entries."""
+        with self._response_cache_lock:
+            self._response_cache[key] = (time.monotonic() + self.cache_ttl, message.model_copy(deep=True))
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self.cache_size:
+                self._response_cache.popitem(last=False)
+
+    def clear_response_cache(self) -> None:
+        """Drop all cached responses."""
+        with self._response_cache_lock:
+            self._response_cache.clear()
 
     def count_tokens(
         self,
@@ -86,6 +86,43 @@ class AWSS3Mixin:
         location = response.get("LocationConstraint") or "us-east-1"
         return location
 
+    def bucket_exists(
+        self,
+        bucket_name: str,
+        execution_role_arn: Optional[str] = None,
+    ) -> bool:
+        """Check whether an S3 bucket exists.
+
+        Uses a single HeadBucket call rather than listing every bucket in the
+        account, so the cost does not grow with the number of buckets.
+
+        Args:
+            bucket_name: Name of the S3 bucket.
+            execution_role_arn: ARN of role to assume for cross-account access.
+
+        Returns:
+            True if the bucket exists, False if it does not.
+
+        Raises:
+            ClientError: For errors other than the bucket not being found
+                (e.g. AccessDenied).
+        """
+        self.logger.debug(f"Checking if bucket exists: {bucket_name}")
+        role_arn = execution_role_arn or getattr(self, "execution_role_arn", None)
+
+        s3 = self.get_aws_client(
+            client_name="s3",
+            execution_role_arn=role_arn,
+        )
+
+        try:
+            s3.head_bucket(Bucket=bucket_name)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchBucket", "NotFound"):
+                return False
+            raise
+        return True
+
     def get_object(
         self,
         bucket: str,
@@ -374,6 +411,11 @@ class AWSS3Mixin:
 
         Returns:
             Dictionary with logging, versioning, lifecycle_rules, and policy.
+            Empty if the bucket does not exist or access to it is denied.
+
+        Raises:
+            ClientError: If checking the bucket fails for any other reason
+                (e.g. throttling or invalid credentials).
         """
         self.logger.debug(f"Getting features for bucket: {bucket_name}")
         role_arn = execution_role_arn or getattr(self, "execution_role_arn", None)
@@ -383,13 +425,21 @@ class AWSS3Mixin:
             execution_role_arn=role_arn,
         )
 
-        bucket = s3_resource.Bucket(bucket_name)
-
-        # Check if bucket exists
-        if not bucket.creation_date:
+        # Check if bucket exists (HeadBucket; Bucket.creation_date would list all buckets).
+        # A bucket we are denied access to (403) is treated like a missing one.
+        try:
+            exists = self.bucket_exists(bucket_name, execution_role_arn=role_arn)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") not in ("403", "AccessDenied", "Forbidden"):
+                raise
+            self.logger.warning(f"Cannot access bucket {bucket_name}: {e}")
+            return {}
+        if not exists:
             self.logger.warning(f"Bucket does not exist: {bucket_name}")
             return {}
 
+        bucket = s3_resource.Bucket(bucket_name)
+
         features: dict[str, Any] = {}
 
         # Logging
@@ -27,8 +27,11 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import threading
 import time
+import weakref
 from abc import ABC
 from typing import TYPE_CHECKING, Any, ClassVar
 
@@ -43,7 +46,7 @@ from tenacity import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
     from langchain_core.tools import StructuredTool
     from pydantic import BaseModel
@@ -80,11 +83,16 @@ class VendorConnectorBase(DirectedInputsClass, ABC):
         TIMEOUT: HTTP timeout in seconds (default 300)
         MIN_REQUEST_INTERVAL: Minimum seconds between requests (rate limiting)
         MAX_RETRIES: Maximum retry attempts (default 5)
+        CLIENT_LIMITS: Connection pool limits for the HTTP client
+        READ_ONLY_TOOL_PREFIXES: Tool name prefixes that are safe to run concurrently
+        THREAD_SAFE_TOOLS: Whether tools may run on this instance from several
+            threads at once (default True). Set False if the connector holds
+            clients that must not be shared across threads.
 
     Instance Attributes:
         logger: Logger instance
         _client: HTTP client (lazy-initialized)
-        _tools: Registered LangChain tools
+        _tools: LangChain wrappers for registered tools, built on first use
     """
 
     # Class-level configuration - override in subclasses
@@ -93,13 +101,17 @@ class VendorConnectorBase(DirectedInputsClass, ABC):
     TIMEOUT: ClassVar[float] = 300.0
     MIN_REQUEST_INTERVAL: ClassVar[float] = 0.0  # No rate limit by default
     MAX_RETRIES: ClassVar[int] = 5
+    CLIENT_LIMITS: ClassVar[httpx.Limits] = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+    READ_ONLY_TOOL_PREFIXES: ClassVar[tuple[str, ...]] = ("get_", "list_", "search_", "describe_", "check_")
+    THREAD_SAFE_TOOLS: ClassVar[bool] = True
 
     # Per-connector-type rate limiting state
     # Each subclass gets its own lock and timestamp to avoid cross-connector interference.
     # This is intentionally class-level (not instance-level) so all instances of the same
     # connector type share rate limiting, but different connector types are independent.
-    _rate_limit_locks: ClassVar[dict[type, threading.Lock]] = {}
-    _last_request_times: ClassVar[dict[type, float]] = {}
+    # Keyed weakly so connector classes created at runtime can still be collected.
+    _rate_limit_locks: ClassVar[weakref.WeakKeyDictionary[type, threading.Lock]] = weakref.WeakKeyDictionary()
+    _last_request_times: ClassVar[weakref.WeakKeyDictionary[type, float]] = weakref.WeakKeyDictionary()
 
     def __init__(
         self,
@@ -137,11 +149,16 @@ class VendorConnectorBase(DirectedInputsClass, ABC):
 
         # Lazy-initialized HTTP client
         self._client: httpx.Client | None = None
-
-        # Tool registry for LangChain/MCP
-        self._tools: list[StructuredTool] = []
-        self._tool_functions: dict[str, Callable] = {}
+        self._client_lock = threading.Lock()
+
+        # Tool registry for LangChain/MCP. register_tool() swaps in new dicts
+        # under _tool_lock instead of mutating, so readers iterate a stable
+        # snapshot without locking.
+        self._tool_lock = threading.Lock()
+        self._tools: dict[str, StructuredTool] = {}
+        self._tool_functions: dict[str, Callable[..., Any]] = {}
         self._tool_schemas: dict[str, type[BaseModel]] = {}
+        self._tool_input_schemas: dict[str, dict[str, Any]] = {}
 
     @property
     def api_key(self) -> str:
@@ -155,7 +172,9 @@ class VendorConnectorBase(DirectedInputsClass, ABC):
     def client(self) -> httpx.Client:
         """Get or create HTTP client with connection pooling."""
         if self._client is None:
-            self._client = httpx.Client(timeout=self._timeout)
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(timeout=self._timeout, limits=self.CLIENT_LIMITS)
         return self._client
 
     def close(self) -> None:
@@ -187,14 +206,15 @@ class VendorConnectorBase(DirectedInputsClass, ABC):
 
         connector_type = type(self)
 
-        # Lazily initialize lock and timestamp for this connector type
-        if connector_type not in self._rate_limit_locks:
-            self._rate_limit_locks[connector_type] = threading.Lock()
-            self._last_request_times[connector_type] = 0.0
+        # Lazily create the lock for this connector type. setdefault is atomic,
+        # so racing first requests still end up sharing a single lock.
+        lock = self._rate_limit_locks.get(connector_type)
+        if lock is None:
+            lock = self._rate_limit_locks.setdefault(connector_type, threading.Lock())
 
-        with self._rate_limit_locks[connector_type]:
+        with lock:
             now = time.time()
-            elapsed = now - self._last_request_times[connector_type]
+            elapsed = now - self._last_request_times.get(connector_type, 0.0)
             if elapsed < self.MIN_REQUEST_INTERVAL:
                 time.sleep(self.MIN_REQUEST_INTERVAL - elapsed)
             self._last_request_times[connector_type] = time.time()
@@ -313,8 +333,8 @@ class VendorConnectorBase(DirectedInputsClass, ABC):
         if dirname:
             os.makedirs(dirname, exist_ok=True)
 
-        # Use a separate client for downloads (different timeout)
-        response = httpx.get(url, timeout=600.0)
+        # Reuse the pooled client with a longer timeout for large files
+        response = self.client.get(url, timeout=600.0)
         response.raise_for_status()
 
         with open(output_path, "wb") as f:
@@ -328,13 +348,15 @@ class VendorConnectorBase(DirectedInputsClass, ABC):
 
     def register_tool(
         self,
-        func: Callable,
+        func: Callable[..., Any],
         name: str | None = None,
         description: str | None = None,
         schema: type[BaseModel] | None = None,
     ) -> None:
         """Register a function as a LangChain tool.
 
+        Safe to call while other threads list or invoke tools.
+
         Args:
             func: The function to register
             name: Tool name (defaults to function name)
@@ -342,12 +364,41 @@ class VendorConnectorBase(DirectedInputsClass, ABC):
             schema: Pydantic model for input schema.
         """
         tool_name = name or func.__name__
-        self._tool_functions[tool_name] = func
-        if schema:
-            self._tool_schemas[tool_name] = schema
+        with self._tool_lock:
+            functions = {**self._tool_functions, tool_name: func}
+            if schema:
+                self._tool_schemas = {**self._tool_schemas, tool_name: schema}
+            self._tool_input_schemas.pop(tool_name, None)
+            self._tools.pop(tool_name, None)
+            self._tool_functions = functions
+
+    def _cache_tool_artifact(
+        self,
+        cache: dict[str, Any],
+        functions: dict[str, Callable[..., Any]],
+        name: str,
+        value: Any,
+    ) -> None:
+        """Store a per-tool cache entry unless tools were registered meanwhile.
 
-    def get_tools(self) -> list[StructuredTool]:
-        """Get all registered tools as LangChain StructuredTools.
+        Args:
+            cache: The cache to store into
+            functions: The _tool_functions snapshot the value was built from
+            name: Tool name
+            value: Built value
+        """
+        with self._tool_lock:
+            if self._tool_functions is functions:
+                cache[name] = value
+
+    def get_tools(self, names: Iterable[str] | None = None) -> list[StructuredTool]:
+        """Get registered tools as LangChain StructuredTools.
+
+        Each tool is wrapped once and reused until it is registered again.
+
+        Args:
+            names: Only return these tools, in this order. Unknown names are
+                skipped. Defaults to all registered tools.
 
         Returns:
             List of StructuredTool instances
@@ -359,12 +410,22 @@ class VendorConnectorBase(DirectedInputsClass, ABC):
             return []
 
         tools = []
-        for name, func in self._tool_functions.items():
-            tool = StructuredTool.from_function(
-                func=func,
-                name=name,
-                description=func.__doc__ or f"Tool: {name}",
-            )
+        functions = self._tool_functions
+        selected: Iterable[tuple[str, Callable[..., Any]]]
+        if names is None:
+            selected = functions.items()
+        else:
+            selected = [(name, functions[name]) for name in names if name in functions]
+
+        for name, func in selected:
+            tool = self._tools.get(name)
+            if tool is None:
+                tool = StructuredTool.from_function(
+                    func=func,
+                    name=name,
+                    description=func.__doc__ or f"Tool: {name}",
+                )
+                self._cache_tool_artifact(self._tools, functions, name, tool)
             tools.append(tool)
 
         return tools
@@ -376,56 +437,62 @@ class VendorConnectorBase(DirectedInputsClass, ABC):
     def get_ai_tool_definitions(self) -> list[dict[str, Any]]:
         """Get tool definitions in Vercel AI SDK-compatible format.
 
+        Input schemas are built once per registered tool; each call returns
+        copies the caller may modify.
+
         Returns:
             List of AI tool definition dicts
         """
-        import inspect
-
-        from vendor_connectors.ai_tools import get_pydantic_schema
-
         definitions = []
-        for name, func in self._tool_functions.items():
-            # Use Pydantic schema if available
-            if name in self._tool_schemas:
-                input_schema = get_pydantic_schema(self._tool_schemas[name])
-            else:
-                # Fallback to inspect-based schema generation
-                sig = inspect.signature(func)
-                properties = {}
-                required = []
-
-                for param_name, param in sig.parameters.items():
-                    if param_name == "self":
-                        continue
-
-                    param_type = "string"
-                    if param.annotation != inspect.Parameter.empty:
-                        if param.annotation in (int, float):
-                            param_type = "number"
-                        elif param.annotation is bool:
-                            param_type = "boolean"
-
-                    properties[param_name] = {"type": param_type}
-
-                    if param.default == inspect.Parameter.empty:
-                        required.append(param_name)
-
-                input_schema = {
-                    "type": "object",
-                    "properties": properties,
-                    "required": required,
-                }
+        functions = self._tool_functions
+        for name, func in functions.items():
+            input_schema = self._tool_input_schemas.get(name)
+            if input_schema is None:
+                input_schema = self._build_input_schema(name, func)
+                self._cache_tool_artifact(self._tool_input_schemas, functions, name, input_schema)
 
             definitions.append(
                 {
                     "name": name,
                     "description": func.__doc__ or f"Tool: {name}",
-                    "inputSchema": input_schema,
+                    "inputSchema": copy.deepcopy(input_schema),
                 }
             )
 
         return definitions
 
+    def _build_input_schema(self, name: str, func: Callable[..., Any]) -> dict[str, Any]:
+        """Build the JSON input schema for a registered tool."""
+        import inspect
+
+        from vendor_connectors.ai_tools import get_pydantic_schema, get_signature_schema_types
+
+        # Use Pydantic schema if available
+        schema = self._tool_schemas.get(name)
+        if schema is not None:
+            return get_pydantic_schema(schema)
+
+        # Fallback to inspect-based schema generation
+        sig = inspect.signature(func)
+        schema_types = get_signature_schema_types(func)
+        properties = {}
+        required = []
+
+        for param_name, param in sig.parameters.items():
+            if param_name == "self":
+                continue
+
+            properties[param_name] = {"type": schema_types.get(param_name, "string")}
+
+            if param.default == inspect.Parameter.empty:
+                required.append(param_name)
+
+        return {
+            "type": "object",
+            "properties": properties,
+            "required": required,
+        }
+
     def handle_ai_tool_call(self, name: str, arguments: dict[str, Any]) -> Any:
         """Handle an AI tool call.
 
@@ -436,9 +503,61 @@ class VendorConnectorBase(DirectedInputsClass, ABC):
         Returns:
             Tool result
         """
-        if name not in self._tool_functions:
+        func = self._tool_functions.get(name)
+        if func is None:
             msg = f"Unknown tool: {name}"
             raise ValueError(msg)
 
-        func = self._tool_functions[name]
         return func(**arguments)
+
+    def _is_read_only_tool(self, name: str) -> bool:
+        """Whether a tool only reads state and may run alongside other calls.
+
+        Args:
+            name: Tool name
+
+        Returns:
+            True if the name starts with one of READ_ONLY_TOOL_PREFIXES
+        """
+        return name.startswith(self.READ_ONLY_TOOL_PREFIXES)
+
+    async def ahandle_ai_tool_calls(
+        self,
+        calls: list[tuple[str, dict[str, Any]]],
+        max_concurrency: int = 5,
+    ) -> list[Any]:
+        """Handle several AI tool calls, overlapping the read-only ones.
+
+        Consecutive read-only calls run concurrently in worker threads on this
+        instance, at most ``max_concurrency`` at a time. Any other call waits
+        for everything before it and runs alone, so side effects keep their
+        order. Connectors whose THREAD_SAFE_TOOLS is False run every call
+        sequentially.
+
+        Args:
+            calls: (tool name, arguments) pairs in the order the model issued them
+            max_concurrency: Maximum tool calls running at once
+
+        Returns:
+            Tool results in the same order as ``calls``
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(name: str, arguments: dict[str, Any]) -> Any:
+            async with semaphore:
+                return await asyncio.to_thread(self.handle_ai_tool_call, name, arguments)
+
+        results: list[Any] = []
+        batch: list[tuple[str, dict[str, Any]]] = []
+        for name, arguments in calls:
+            if self.THREAD_SAFE_TOOLS and self._is_read_only_tool(name):
+                batch.append((name, arguments))
+                continue
+            if batch:
+                results.extend(await asyncio.gather(*(run(n, a) for n, a in batch)))
+                batch = []
+            results.append(await run(name, arguments))
+        if batch:
+            results.extend(await asyncio.gather(*(run(n, a) for n, a in batch)))
+
+        return results
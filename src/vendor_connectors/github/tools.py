@@ -6,6 +6,7 @@ AI agent frameworks.
 
 from __future__ import annotations
 
+import functools
 from typing import Any, Optional
 
 from pydantic import BaseModel, Field
@@ -307,13 +308,23 @@ TOOL_DEFINITIONS = [
 
 
 def get_langchain_tools() -> list[Any]:
-    """Get all GitHub tools as LangChain StructuredTools."""
+    """Get all GitHub tools as LangChain StructuredTools.
+
+    The wrappers and their argument schemas are built once; each call
+    returns shallow copies so callers can configure their tools independently.
+    """
+    return [tool.model_copy() for tool in _build_langchain_tools()]
+
+
+@functools.cache
+def _build_langchain_tools() -> tuple[Any, ...]:
+    """Build the LangChain wrappers for TOOL_DEFINITIONS."""
     try:
         from langchain_core.tools import StructuredTool
     except ImportError as e:
         raise ImportError("langchain-core is required for LangChain tools.") from e
 
-    return [
+    return tuple(
         StructuredTool.from_function(
             func=defn["func"],
             name=defn["name"],
@@ -321,7 +332,7 @@ def get_langchain_tools() -> list[Any]:
             args_schema=defn.get("schema") or defn.get("args_schema"),
         )
         for defn in TOOL_DEFINITIONS
-    ]
+    )
 
 
 def get_crewai_tools() -> list[Any]:
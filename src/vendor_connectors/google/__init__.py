@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import threading
+from collections import OrderedDict
 from collections.abc import Sequence
 from typing import Any, Optional
 
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document
 from lifecyclelogging import Logging
 
 from vendor_connectors.base import VendorConnectorBase
@@ -23,6 +27,72 @@ DEFAULT_SCOPES = [
     "https://www.googleapis.com/auth/admin.directory.orgunit.readonly",
 ]
 
+# Parsed service account credentials shared across connector instances.
+# Parsing the private key is the expensive part of authentication, so
+# connectors built from the same service account JSON reuse one object.
+# Keyed by (service account fingerprint, scopes, subject) and bounded so that
+# impersonating many users does not keep every delegated credential alive.
+_CREDENTIALS_CACHE_SIZE = 4
+_credentials_cache: OrderedDict[tuple[str, tuple[str, ...], str], service_account.Credentials] = OrderedDict()
+_credentials_cache_lock = threading.Lock()
+
+
+def _service_account_fingerprint(service_account_info: dict[str, Any]) -> str:
+    """Return a stable hash of service account JSON for use as a cache key."""
+    payload = json.dumps(service_account_info, sort_keys=True).encode()
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _load_credentials(
+    service_account_info: dict[str, Any],
+    scopes: Sequence[str],
+    subject: Optional[str] = None,
+) -> service_account.Credentials:
+    """Get cached service account credentials, creating them on first use."""
+    cache_key = (_service_account_fingerprint(service_account_info), tuple(scopes), subject or "")
+    with _credentials_cache_lock:
+        credentials = _credentials_cache.get(cache_key)
+        if credentials is None:
+            credentials = service_account.Credentials.from_service_account_info(
+                service_account_info,
+                scopes=list(scopes),
+            )
+            if subject:
+                credentials = credentials.with_subject(subject)
+            _credentials_cache[cache_key] = credentials
+            while len(_credentials_cache) > _CREDENTIALS_CACHE_SIZE:
+                _credentials_cache.popitem(last=False)
+        else:
+            _credentials_cache.move_to_end(cache_key)
+    return credentials
+
+
+def clear_credential_cache() -> None:
+    """Clear cached service account credentials (useful for testing)."""
+    with _credentials_cache_lock:
+        _credentials_cache.clear()
+
+
+# Discovery documents keyed by (service name, version). Built service objects
+# stay per-connector because they wrap a non-thread-safe httplib2.Http; only
+# the document they are built from is shared.
+_discovery_docs: dict[tuple[str, str], str] = {}
+
+
+def _build_service(service_name: str, version: str, credentials: Any) -> Any:
+    """Build a Google API service client from a cached discovery document.
+
+    Falls back to ``build()`` for APIs without a bundled discovery document.
+    """
+    cache_key = (service_name, version)
+    document = _discovery_docs.get(cache_key)
+    if document is None:
+        document = discovery_cache.get_static_doc(service_name, version)
+        if document is None:
+            return build(service_name, version, credentials=credentials)
+        _discovery_docs[cache_key] = document
+    return build_from_document(document, credentials=credentials)
+
 
 class GoogleConnector(VendorConnectorBase):
     """Google Cloud and Workspace base connector.
@@ -35,6 +105,10 @@ class GoogleConnector(VendorConnectorBase):
     Higher-level operations are provided via mixin classes from submodules.
     """
 
+    # Cached googleapiclient services sit on a non-thread-safe httplib2.Http,
+    # so tool calls on one instance must not overlap.
+    THREAD_SAFE_TOOLS = False
+
     def __init__(
         self,
         service_account_info: Optional[dict[str, Any] | str] = None,
@@ -65,13 +139,16 @@ class GoogleConnector(VendorConnectorBase):
         # Parse if string
         if isinstance(service_account_info, str):
             try:
-                service_account_info = json.loads(service_account_info)
+                parsed_info: dict[str, Any] = json.loads(service_account_info)
             except json.JSONDecodeError as e:
                 self.logger.error(f"Failed to parse GOOGLE_SERVICE_ACCOUNT JSON: {e}")
                 raise
+        else:
+            parsed_info = service_account_info
 
-        self.service_account_info = service_account_info
+        self.service_account_info = parsed_info
         self._credentials: Optional[service_account.Credentials] = None
+        self._project_id: Optional[str] = None
         self._services: dict[str, Any] = {}
 
         self.logger.info("Initialized Google connector")
@@ -84,19 +161,33 @@ class GoogleConnector(VendorConnectorBase):
     def credentials(self) -> service_account.Credentials:
         """Get or create Google credentials.
 
+        Credentials are shared with other connectors using the same service
+        account, scopes, and subject.
+
         Returns:
             Authenticated service account credentials.
         """
         if self._credentials is None:
-            self._credentials = service_account.Credentials.from_service_account_info(
-                self.service_account_info,
-                scopes=self.scopes,
-            )
-            if self.subject:
-                self._credentials = self._credentials.with_subject(self.subject)
+            self._credentials = _load_credentials(self.service_account_info, self.scopes, self.subject)
 
         return self._credentials
 
+    @property
+    def project_id(self) -> Optional[str]:
+        """Get the default Google Cloud project ID.
+
+        Resolved once from the GOOGLE_PROJECT_ID input, falling back to the
+        project_id field of the service account.
+
+        Returns:
+            Project ID, or None if it cannot be determined.
+        """
+        if self._project_id is None:
+            self._project_id = self.get_input("GOOGLE_PROJECT_ID", required=False) or self.service_account_info.get(
+                "project_id"
+            )
+        return self._project_id
+
     def get_credentials_for_subject(self, subject: str) -> service_account.Credentials:
         """Get credentials impersonating a specific user.
 
@@ -106,10 +197,7 @@ class GoogleConnector(VendorConnectorBase):
         Returns:
             Credentials with the specified subject.
         """
-        return service_account.Credentials.from_service_account_info(
-            self.service_account_info,
-            scopes=self.scopes,
-        ).with_subject(subject)
+        return _load_credentials(self.service_account_info, self.scopes, subject)
 
     def get_connector_for_user(
         self,
@@ -156,7 +244,7 @@ class GoogleConnector(VendorConnectorBase):
         cache_key = f"{service_name}:{version}:{subject or ''}"
         if cache_key not in self._services:
             creds = self.get_credentials_for_subject(subject) if subject else self.credentials
-            self._services[cache_key] = build(service_name, version, credentials=creds)
+            self._services[cache_key] = _build_service(service_name, version, creds)
             self.logger.debug(f"Created Google service: {service_name} v{version}")
         return self._services[cache_key]
 
@@ -567,6 +655,7 @@ __all__ = [
     # Core connector classes
     "GoogleConnector",
     "GoogleConnectorFull",
+    "clear_credential_cache",
     # Mixins
     "GoogleWorkspaceMixin",
     "GoogleCloudMixin",
@@ -25,6 +25,7 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -338,12 +339,21 @@ TOOL_DEFINITIONS = [
 def get_langchain_tools() -> list[Any]:
     """Get all Google tools as LangChain StructuredTools.
 
+    The wrappers and their argument schemas are built once; each call
+    returns shallow copies so callers can configure their tools independently.
+
     Returns:
         List of LangChain StructuredTool objects.
 
     Raises:
         ImportError: If langchain-core is not installed.
     """
+    return [tool.model_copy() for tool in _build_langchain_tools()]
+
+
+@functools.cache
+def _build_langchain_tools() -> tuple[Any, ...]:
+    """Build the LangChain wrappers for TOOL_DEFINITIONS."""
     try:
         from langchain_core.tools import StructuredTool
     except ImportError as e:
@@ -351,7 +361,7 @@ def get_langchain_tools() -> list[Any]:
             "langchain-core is required for LangChain tools.\nInstall with: pip install vendor-connectors[langchain]"
         ) from e
 
-    return [
+    return tuple(
         StructuredTool.from_function(
             func=defn["func"],
             name=defn["name"],
@@ -359,7 +369,7 @@ def get_langchain_tools() -> list[Any]:
             args_schema=defn.get("schema") or defn.get("args_schema"),
         )
         for defn in TOOL_DEFINITIONS
-    ]
+    )
 
 
 def get_crewai_tools() -> list[Any]:
@@ -20,11 +20,14 @@ with zero custom code - just standard MCP over stdio.
 
 from __future__ import annotations
 
+import asyncio
 import inspect
-import json
+import threading
 from typing import Any, Callable
 
-from vendor_connectors.registry import get_connector, list_connectors
+from vendor_connectors._compat import dumps_compact
+from vendor_connectors.ai_tools import get_signature_schema_types
+from vendor_connectors.registry import get_connector, get_connectors_view
 
 
 def _check_mcp_installed() -> bool:
@@ -37,9 +40,10 @@ def _check_mcp_installed() -> bool:
         return False
 
 
-def _get_method_schema(method: Callable) -> dict[str, Any]:
+def _get_method_schema(method: Callable[..., Any]) -> dict[str, Any]:
     """Generate JSON schema from method signature."""
     sig = inspect.signature(method)
+    schema_types = get_signature_schema_types(method)
     properties = {}
     required = []
 
@@ -47,21 +51,7 @@ def _get_method_schema(method: Callable) -> dict[str, Any]:
         if name in ("self", "cls"):
             continue
 
-        prop: dict[str, Any] = {"type": "string"}  # Default
-
-        # Try to get type from annotations
-        if param.annotation != inspect.Parameter.empty:
-            ann = param.annotation
-            if ann is int:
-                prop = {"type": "integer"}
-            elif ann is float:
-                prop = {"type": "number"}
-            elif ann is bool:
-                prop = {"type": "boolean"}
-            elif ann is list or (hasattr(ann, "__origin__") and ann.__origin__ is list):
-                prop = {"type": "array"}
-            elif ann is dict or (hasattr(ann, "__origin__") and ann.__origin__ is dict):
-                prop = {"type": "object"}
+        prop: dict[str, Any] = {"type": schema_types.get(name, "string")}
 
         # Get description from docstring if available
         if method.__doc__:
@@ -86,7 +76,7 @@ def _get_method_schema(method: Callable) -> dict[str, Any]:
     }
 
 
-def _get_public_methods(connector_class: type) -> list[tuple[str, Callable]]:
+def _get_public_methods(connector_class: type) -> list[tuple[str, Callable[..., Any]]]:
     """Get public methods from a connector class (excluding dunder and private)."""
     methods = []
     for name in dir(connector_class):
@@ -98,6 +88,43 @@ def _get_public_methods(connector_class: type) -> list[tuple[str, Callable]]:
     return methods
 
 
+def _thread_local_handlers(tools: dict[str, dict[str, Any]]) -> Callable[[str], Callable[..., Any]]:
+    """Build a resolver from tool name to bound connector method.
+
+    Connectors are instantiated per worker thread because some of them (e.g.
+    GoogleConnector's cached API services) are not safe to share across
+    threads. Within a thread, each connector is created once and shared by
+    all of its tools, and each tool's bound method is cached on first call.
+
+    Args:
+        tools: Tool registry mapping tool name to its connector and method
+
+    Returns:
+        Function returning the handler for a tool name
+    """
+    local = threading.local()
+
+    def get_handler(name: str) -> Callable[..., Any]:
+        handlers: dict[str, Callable[..., Any]]
+        try:
+            handlers = local.handlers
+        except AttributeError:
+            handlers = local.handlers = {}
+            local.instances = {}
+
+        handler = handlers.get(name)
+        if handler is None:
+            tool = tools[name]
+            connector = local.instances.get(tool["connector"])
+            if connector is None:
+                # Will get credentials from env
+                connector = local.instances[tool["connector"]] = get_connector(tool["connector"])
+            handler = handlers[name] = getattr(connector, tool["method"])
+        return handler
+
+    return get_handler
+
+
 def create_server():
     """Create the unified MCP server with all registered connectors."""
     try:
@@ -112,13 +139,13 @@ def create_server():
     TOOLS: dict[str, dict[str, Any]] = {}
 
     # Discover all connectors
-    connectors = list_connectors()
+    connectors = get_connectors_view()
 
     for connector_name, connector_class in connectors.items():
         # Get public methods
         for method_name, method in _get_public_methods(connector_class):
             # Skip common base class methods
-            if method_name in ("close", "request", "get_input", "register_tool"):
+            if method_name in ("close", "request", "get_input", "register_tool", "ahandle_ai_tool_calls"):
                 continue
 
             tool_name = f"{connector_name}_{method_name}"
@@ -143,6 +170,8 @@ def create_server():
                 "parameters": schema,
             }
 
+    get_handler = _thread_local_handlers(TOOLS)
+
     @server.list_tools()
     async def list_tools() -> list[Tool]:
         """Return all available tools."""
@@ -157,17 +186,14 @@ def create_server():
         if name not in TOOLS:
             return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
-        tool = TOOLS[name]
-        connector_name = tool["connector"]
-        method_name = tool["method"]
+        def invoke() -> Any:
+            return get_handler(name)(**arguments)
 
         try:
-            # Instantiate connector (will get credentials from env)
-            connector = get_connector(connector_name)
-
-            # Get and call the method
-            method = getattr(connector, method_name)
-            result = method(**arguments)
+            # Connector methods do blocking I/O; run them in a worker thread so
+            # concurrent tool calls from the client overlap instead of queueing
+            # behind the event loop.
+            result = await asyncio.to_thread(invoke)
 
             # Handle async methods
             if inspect.iscoroutine(result):
@@ -179,7 +205,7 @@ def create_server():
             elif hasattr(result, "__iter__") and not isinstance(result, (str, dict)):
                 result = [r.model_dump() if hasattr(r, "model_dump") else r for r in result]
 
-            return [TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
+            return [TextContent(type="text", text=dumps_compact(result))]
 
         except Exception as e:
             return [TextContent(type="text", text=f"Error: {type(e).__name__}: {e}")]
@@ -189,8 +215,6 @@ def create_server():
 
 def main() -> int:
     """Run the MCP server over stdio."""
-    import asyncio
-
     try:
         from mcp.server.stdio import stdio_server
     except ImportError:
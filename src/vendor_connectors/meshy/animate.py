@@ -33,7 +33,7 @@ def create(request: AnimationRequest) -> str:
 def get(task_id: str) -> AnimationResult:
     """Get task status."""
     response = base.request("GET", f"animations/{task_id}", version="v1")
-    return AnimationResult(**response.json())
+    return AnimationResult.model_validate_json(response.content)
 
 
 def poll(task_id: str, interval: float = 5.0, timeout: float = 600.0) -> AnimationResult:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import heapq
+from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
 
@@ -9,7 +11,7 @@ from enum import Enum
 # Do not edit manually - run the script to update.
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimationMeta:
     """Metadata for a Meshy animation."""
 
@@ -4814,6 +4816,15 @@ ANIMATIONS: dict[int, AnimationMeta] = {
 }
 
 
+# Category and subcategory indexes, built once so lookups don't scan ANIMATIONS
+_BY_CATEGORY: defaultdict[str, list[AnimationMeta]] = defaultdict(list)
+_BY_SUBCATEGORY: defaultdict[str, list[AnimationMeta]] = defaultdict(list)
+for _anim in ANIMATIONS.values():
+    _BY_CATEGORY[_anim.category].append(_anim)
+    _BY_SUBCATEGORY[_anim.subcategory].append(_anim)
+del _anim
+
+
 # Curated animation sets for common game use cases
 
 
@@ -4836,35 +4847,28 @@ class GameAnimationSet:
     EXPLORATION: list[int] = []
 
 
+def _first_ids(index: dict[str, list[AnimationMeta]], *keys: str, limit: int = 10) -> list[int]:
+    """Get the lowest animation IDs across the given index buckets."""
+    return heapq.nsmallest(limit, (anim.id for key in keys for anim in index.get(key, ())))
+
+
 # Populate animation sets from available animations
 def _populate_animation_sets() -> None:
     """Populate animation sets based on available animations."""
-    all_ids = set(ANIMATIONS.keys())
-
     # Basic movement: Idle + Walking + Running
-    GameAnimationSet.BASIC_MOVEMENT = [
-        aid for aid in all_ids if ANIMATIONS[aid].subcategory in ("Idle", "Walking", "Running")
-    ][:10]  # Limit to first 10
+    GameAnimationSet.BASIC_MOVEMENT = _first_ids(_BY_SUBCATEGORY, "Idle", "Walking", "Running")
 
     # Combat: Fighting category
-    GameAnimationSet.COMBAT = [aid for aid in all_ids if ANIMATIONS[aid].category == "Fighting"][
-        :10
-    ]
+    GameAnimationSet.COMBAT = _first_ids(_BY_CATEGORY, "Fighting")
 
     # Social: Interacting subcategory
-    GameAnimationSet.SOCIAL = [
-        aid for aid in all_ids if ANIMATIONS[aid].subcategory == "Interacting"
-    ][:10]
+    GameAnimationSet.SOCIAL = _first_ids(_BY_SUBCATEGORY, "Interacting")
 
     # Celebration: Dancing category
-    GameAnimationSet.CELEBRATION = [
-        aid for aid in all_ids if ANIMATIONS[aid].category == "Dancing"
-    ][:10]
+    GameAnimationSet.CELEBRATION = _first_ids(_BY_CATEGORY, "Dancing")
 
     # Exploration: LookingAround + Idle
-    GameAnimationSet.EXPLORATION = [
-        aid for aid in all_ids if ANIMATIONS[aid].subcategory in ("LookingAround", "Idle")
-    ][:10]
+    GameAnimationSet.EXPLORATION = _first_ids(_BY_SUBCATEGORY, "LookingAround", "Idle")
 
 
 # Initialize sets on module load
@@ -4873,14 +4877,14 @@ _populate_animation_sets()
 
 def get_animations_by_category(category: AnimationCategory) -> list[AnimationMeta]:
     """Get all animations in a category."""
-    return [anim for anim in ANIMATIONS.values() if anim.category == category.value]
+    return list(_BY_CATEGORY.get(category.value, ()))
 
 
 def get_animations_by_subcategory(
     subcategory: AnimationSubcategory,
 ) -> list[AnimationMeta]:
     """Get all animations in a subcategory."""
-    return [anim for anim in ANIMATIONS.values() if anim.subcategory == subcategory.value]
+    return list(_BY_SUBCATEGORY.get(subcategory.value, ()))
 
 
 def get_animation(action_id: int) -> AnimationMeta:
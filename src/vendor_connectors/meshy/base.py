@@ -11,7 +11,13 @@ vendor-connectors. Credentials can come from:
 
 from __future__ import annotations
 
+import atexit
+import threading
 import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import TypedDict
+from urllib.parse import urlparse
 
 import httpx
 from directed_inputs_class import DirectedInputsClass
@@ -32,15 +38,199 @@ class MeshyAPIError(Exception):
         self.status_code = status_code
 
 
+class RateLimiter:
+    """Client-side sliding-window rate limiter.
+
+    Enforces a requests-per-minute budget, an optional tokens-per-minute
+    budget, and an optional cap on in-flight requests. Thread-safe; one
+    instance is shared by every caller using the same API key.
+
+    The request budget adapts AIMD-style: ``on_limit()`` (a 429) multiplies
+    the effective RPM by ``beta`` and ``on_success()`` adds ``alpha`` back,
+    up to the configured ``rpm`` ceiling.
+
+    Usage:
+        limiter = RateLimiter(rpm=60, max_concurrency=5)
+        limiter.acquire()
+        with limiter:
+            response = client.get(url)
+        limiter.on_success()
+    """
+
+    # Every Meshy request goes through acquire(); slots keep its attribute
+    # reads off the instance dict.
+    __slots__ = (
+        "rpm",
+        "alpha",
+        "beta",
+        "effective_rpm",
+        "tpm",
+        "max_concurrency",
+        "window",
+        "_requests",
+        "_tokens",
+        "_token_total",
+        "_lock",
+        "_semaphore",
+    )
+
+    def __init__(
+        self,
+        rpm: int,
+        tpm: int | None = None,
+        max_concurrency: int | None = None,
+        window: float = 60.0,
+        alpha: float = 1.0,
+        beta: float = 0.5,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            rpm: Maximum requests per window
+            tpm: Maximum tokens per window (None disables token limiting)
+            max_concurrency: Maximum in-flight requests (None for unlimited)
+            window: Window length in seconds (default 60)
+            alpha: Requests per window restored after each success
+            beta: Factor applied to the request budget after a rate limit
+        """
+        self.rpm = rpm
+        self.alpha = alpha
+        self.beta = beta
+        self.effective_rpm = float(rpm)
+        self.tpm = tpm
+        self.max_concurrency = max_concurrency
+        self.window = window
+        self._requests: deque[float] = deque()
+        self._tokens: deque[tuple[float, int]] = deque()
+        self._token_total = 0
+        self._lock = threading.Lock()
+        self._semaphore = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+
+    def acquire(self, tokens: int = 1) -> None:
+        """Block until a request of the given token cost fits in the window.
+
+        Args:
+            tokens: Estimated token cost of the request
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._evict(now)
+                wait = self._wait_time(now, tokens)
+                if wait <= 0:
+                    self._requests.append(now)
+                    if self.tpm:
+                        self._tokens.append((now, tokens))
+                        self._token_total += tokens
+                    return
+            time.sleep(wait)
+
+    def _evict(self, now: float) -> None:
+        """Drop requests and tokens that have left the window."""
+        cutoff = now - self.window
+        while self._requests and self._requests[0] <= cutoff:
+            self._requests.popleft()
+        while self._tokens and self._tokens[0][0] <= cutoff:
+            _, count = self._tokens.popleft()
+            self._token_total -= count
+
+    def _wait_time(self, now: float, tokens: int) -> float:
+        """Seconds until a request of the given cost would be admitted."""
+        wait = 0.0
+        budget = max(1, int(self.effective_rpm))
+        if len(self._requests) >= budget:
+            wait = self._requests[-budget] + self.window - now
+        if self.tpm and self._tokens and self._token_total + tokens > self.tpm:
+            excess = self._token_total + tokens - self.tpm
+            released = 0
+            for timestamp, count in self._tokens:
+                released += count
+                if released >= excess:
+                    wait = max(wait, timestamp + self.window - now)
+                    break
+        return wait
+
+    def on_success(self) -> None:
+        """Additively restore the request budget after a successful call."""
+        with self._lock:
+            self.effective_rpm = min(float(self.rpm), self.effective_rpm + self.alpha)
+
+    def on_limit(self) -> None:
+        """Multiplicatively shrink the request budget after a rate limit."""
+        with self._lock:
+            self.effective_rpm = max(1.0, self.effective_rpm * self.beta)
+
+    def __enter__(self):
+        """Reserve an in-flight request slot."""
+        if self._semaphore:
+            self._semaphore.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Release the in-flight request slot."""
+        if self._semaphore:
+            self._semaphore.release()
+
+
+class ProviderProfile(TypedDict):
+    """Client-side rate limits for a provider, as RateLimiter arguments."""
+
+    rpm: int
+    tpm: int | None
+    max_concurrency: int | None
+    alpha: float
+    beta: float
+
+
+# Default client-side limits per provider, matched against the API host.
+PROVIDER_PROFILES: dict[str, ProviderProfile] = {
+    "meshy": {"rpm": 60, "tpm": None, "max_concurrency": 5, "alpha": 1.0, "beta": 0.5},
+}
+
+
 # Global client state
 _client: httpx.Client | None = None
+_client_lock = threading.Lock()
+# One pooled client serves every API call, poll and download, so polling
+# loops and concurrent tool calls reuse warm TLS connections.
+CLIENT_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
 _inputs: DirectedInputsClass | None = None
 _last_request_time: float = 0
+_rate_limit_lock = threading.Lock()
 _min_request_interval: float = 0.5  # 500ms between requests
+_limiters: dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
 
 BASE_URL = "https://api.meshy.ai"
 
 
+def get_provider_profile(base_url: str = BASE_URL) -> ProviderProfile:
+    """Get the rate limit profile for an API base URL.
+
+    Args:
+        base_url: API base URL (provider is detected from the host)
+
+    Returns:
+        Profile dict with rpm, tpm, max_concurrency, alpha, and beta keys
+    """
+    host = urlparse(base_url).hostname or ""
+    for provider, profile in PROVIDER_PROFILES.items():
+        if provider in host:
+            return profile
+    return PROVIDER_PROFILES["meshy"]
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the shared rate limiter for the configured API key."""
+    api_key = get_api_key()
+    with _limiters_lock:
+        limiter = _limiters.get(api_key)
+        if limiter is None:
+            limiter = RateLimiter(**get_provider_profile(BASE_URL))
+            _limiters[api_key] = limiter
+    return limiter
+
+
 def _get_inputs() -> DirectedInputsClass:
     """Get or create the DirectedInputsClass instance."""
     global _inputs
@@ -72,29 +262,30 @@ def get_api_key() -> str:
 
 
 def get_client() -> httpx.Client:
-    """Get or create HTTP client."""
+    """Get or create the shared, connection-pooled HTTP client."""
     global _client
     if _client is None:
-        _client = httpx.Client(timeout=300.0)
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(timeout=300.0, limits=CLIENT_LIMITS)
     return _client
 
 
 def close():
     """Close the HTTP client."""
     global _client
-    if _client:
-        _client.close()
-        _client = None
+    with _client_lock:
+        if _client:
+            _client.close()
+            _client = None
 
 
-def _rate_limit():
-    """Simple rate limiting with thread safety."""
-    import threading
+atexit.register(close)
 
-    global _last_request_time, _rate_limit_lock
 
-    if "_rate_limit_lock" not in globals():
-        _rate_limit_lock = threading.Lock()
+def _rate_limit():
+    """Simple rate limiting with thread safety."""
+    global _last_request_time
 
     with _rate_limit_lock:
         now = time.time()
@@ -104,6 +295,28 @@ def _rate_limit():
         _last_request_time = time.time()
 
 
+def parse_retry_after(value: str | None, default: float = 5.0) -> float:
+    """Parse a Retry-After header into seconds to wait.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+        default: Seconds to use when the header is missing or unparseable
+
+    Returns:
+        Non-negative number of seconds
+    """
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
+
+
 def _headers() -> dict[str, str]:
     """Build request headers."""
     return {
@@ -139,18 +352,19 @@ def request(
         RateLimitError: On 429 (will retry)
         MeshyAPIError: On other API errors
     """
+    limiter = get_rate_limiter()
+    limiter.acquire()
     _rate_limit()
 
     url = f"{BASE_URL}/openapi/{version}/{endpoint}"
-    response = get_client().request(method, url, headers=_headers(), **kwargs)
+    with limiter:
+        response = get_client().request(method, url, headers=_headers(), **kwargs)
 
     # Handle rate limiting
     if response.status_code == 429:
-        retry_after = response.headers.get("retry-after", "5")
-        try:
-            time.sleep(float(retry_after))
-        except ValueError:
-            time.sleep(5)
+        limiter.on_limit()
+        retry_after = parse_retry_after(response.headers.get("retry-after"))
+        time.sleep(retry_after)
         msg = f"Rate limit exceeded, retried after {retry_after}s"
         raise RateLimitError(msg)
 
@@ -167,6 +381,7 @@ def request(
             status_code=response.status_code,
         )
 
+    limiter.on_success()
     return response
 
 
@@ -186,10 +401,12 @@ def download(url: str, output_path: str) -> int:
     if dirname:
         _os.makedirs(dirname, exist_ok=True)
 
-    response = httpx.get(url)
-    response.raise_for_status()
-
-    with open(output_path, "wb") as f:
-        f.write(response.content)
+    size = 0
+    with get_client().stream("GET", url) as response:
+        response.raise_for_status()
+        with open(output_path, "wb") as f:
+            for chunk in response.iter_bytes():
+                f.write(chunk)
+                size += len(chunk)
 
-    return len(response.content)
+    return size
@@ -32,7 +32,7 @@ def create(request: Image3DRequest) -> str:
 def get(task_id: str) -> Image3DResult:
     """Get task status."""
     response = base.request("GET", f"image-to-3d/{task_id}", version="v2")
-    return Image3DResult(**response.json())
+    return Image3DResult.model_validate_json(response.content)
 
 
 def refine(task_id: str) -> str:
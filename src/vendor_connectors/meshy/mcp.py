@@ -29,224 +29,39 @@ Configure in Claude Desktop (~/Library/Application Support/Claude/claude_desktop
 
 from __future__ import annotations
 
-import json
+import asyncio
 from typing import Any
 
+from vendor_connectors._compat import dumps_compact
+
 
 def _create_mcp_tools() -> list[Any]:
     """Create MCP tool definitions from Meshy functions.
 
     Returns:
-        List of MCP Tool objects
+        List of (MCP Tool, handler) pairs
     """
     try:
         from mcp.types import Tool
     except ImportError as e:
         raise ImportError("MCP SDK not installed. Install with: pip install vendor-connectors[meshy-mcp]") from e
 
-    # Import Meshy tool functions
-    from vendor_connectors.meshy import tools
-
-    # Define tool schemas manually for better control
-    tool_schemas = [
-        {
-            "name": "text3d_generate",
-            "description": (
-                "Generate a 3D GLB model from a text description using Meshy AI. "
-                "Provide a detailed prompt describing the model. Returns the task_id, "
-                "status, model_url, and thumbnail_url on success."
-            ),
-            "func": tools.text3d_generate,
-            "parameters": {
-                "prompt": {
-                    "type": "string",
-                    "description": "Detailed text description of the 3D model",
-                    "required": True,
-                },
-                "art_style": {
-                    "type": "string",
-                    "description": "Art style: realistic or sculpture (for sculpture, PBR is not recommended)",
-                    "enum": ["realistic", "sculpture"],
-                    "default": "realistic",
-                },
-                "negative_prompt": {
-                    "type": "string",
-                    "description": "Things to avoid in the generation",
-                    "default": "",
-                },
-                "target_polycount": {
-                    "type": "integer",
-                    "description": "Target polygon count for the model",
-                    "default": 30000,
-                },
-                "enable_pbr": {
-                    "type": "boolean",
-                    "description": "Enable PBR (physically-based rendering) materials",
-                    "default": True,
-                },
-            },
-        },
-        {
-            "name": "image3d_generate",
-            "description": (
-                "Generate a 3D GLB model from an image using Meshy AI. "
-                "Provide a URL to the source image. Returns the task_id, "
-                "status, model_url, and thumbnail_url on success."
-            ),
-            "func": tools.image3d_generate,
-            "parameters": {
-                "image_url": {"type": "string", "description": "URL to the source image", "required": True},
-                "topology": {
-                    "type": "string",
-                    "description": "Mesh topology type",
-                    "enum": ["", "quad", "triangle"],
-                    "default": "",
-                },
-                "target_polycount": {
-                    "type": "integer",
-                    "description": "Target polygon count for the model",
-                    "default": 15000,
-                },
-                "enable_pbr": {
-                    "type": "boolean",
-                    "description": "Enable PBR (physically-based rendering) materials",
-                    "default": True,
-                },
-            },
-        },
-        {
-            "name": "rig_model",
-            "description": (
-                "Add a skeleton/rig to a static 3D model. This is required before "
-                "you can apply animations. Takes the model's task ID and returns "
-                "a new task ID for the rigging operation."
-            ),
-            "func": tools.rig_model,
-            "parameters": {
-                "model_id": {"type": "string", "description": "Task ID of the static model to rig", "required": True},
-                "wait": {"type": "boolean", "description": "Wait for rigging to complete", "default": True},
-            },
-        },
-        {
-            "name": "apply_animation",
-            "description": (
-                "Apply an animation to a rigged 3D model. Use list_animations to "
-                "see available animation IDs. The model must be rigged first."
-            ),
-            "func": tools.apply_animation,
-            "parameters": {
-                "model_id": {"type": "string", "description": "Task ID of the rigged model", "required": True},
-                "animation_id": {
-                    "type": "integer",
-                    "description": "Animation ID from the Meshy catalog (use list_animations)",
-                    "required": True,
-                },
-                "wait": {"type": "boolean", "description": "Wait for animation to complete", "default": True},
-            },
-        },
-        {
-            "name": "retexture_model",
-            "description": (
-                "Apply new textures to an existing 3D model. Great for creating "
-                "color variants or material changes without regenerating the mesh."
-            ),
-            "func": tools.retexture_model,
-            "parameters": {
-                "model_id": {"type": "string", "description": "Task ID of the model to retexture", "required": True},
-                "texture_prompt": {
-                    "type": "string",
-                    "description": "Description of the new texture/appearance",
-                    "required": True,
-                },
-                "enable_pbr": {
-                    "type": "boolean",
-                    "description": "Enable PBR (physically-based rendering) materials",
-                    "default": True,
-                },
-                "wait": {"type": "boolean", "description": "Wait for retexturing to complete", "default": True},
-            },
-        },
-        {
-            "name": "list_animations",
-            "description": (
-                "List available animations from the Meshy animation catalog. "
-                "Optionally filter by category. Returns animation IDs and names "
-                "that can be used with apply_animation."
+    from vendor_connectors.ai_tools import get_pydantic_schema
+    from vendor_connectors.meshy.tools import TOOL_DEFINITIONS
+
+    # Built from the shared tool definitions so MCP exposes exactly the same
+    # tools, descriptions and argument schemas as the agent framework wrappers.
+    return [
+        (
+            Tool(
+                name=defn["name"],
+                description=defn["description"],
+                inputSchema=get_pydantic_schema(defn["schema"]),
             ),
-            "func": tools.list_animations,
-            "parameters": {
-                "category": {
-                    "type": "string",
-                    "description": "Optional category filter (Fighting, WalkAndRun, Dancing, etc.)",
-                    "default": "",
-                },
-                "limit": {"type": "integer", "description": "Maximum number of animations to return", "default": 50},
-            },
-        },
-        {
-            "name": "check_task_status",
-            "description": (
-                "Check the current status of a Meshy AI task. Returns status "
-                "(pending, processing, succeeded, failed), progress percentage, "
-                "and model URL if complete."
-            ),
-            "func": tools.check_task_status,
-            "parameters": {
-                "task_id": {"type": "string", "description": "The Meshy task ID to check", "required": True},
-                "task_type": {
-                    "type": "string",
-                    "description": "Task type",
-                    "enum": ["text-to-3d", "image-to-3d", "rigging", "animation", "retexture"],
-                    "default": "text-to-3d",
-                },
-            },
-        },
-        {
-            "name": "get_animation",
-            "description": "Get details of a specific animation by ID, including name, category, subcategory, and preview URL.",
-            "func": tools.get_animation,
-            "parameters": {
-                "animation_id": {"type": "integer", "description": "The animation ID number", "required": True},
-            },
-        },
-    ]
-
-    # Convert to MCP Tool objects
-    mcp_tools = []
-    for schema in tool_schemas:
-        # Build JSON schema properties and required list
-        properties = {}
-        required = []
-
-        for param_name, param_def in schema["parameters"].items():
-            prop = {
-                "type": param_def["type"],
-                "description": param_def["description"],
-            }
-
-            if "default" in param_def:
-                prop["default"] = param_def["default"]
-
-            if "enum" in param_def:
-                prop["enum"] = param_def["enum"]
-
-            properties[param_name] = prop
-
-            if param_def.get("required", False):
-                required.append(param_name)
-
-        tool = Tool(
-            name=schema["name"],
-            description=schema["description"],
-            inputSchema={
-                "type": "object",
-                "properties": properties,
-                "required": required,
-            },
+            defn["func"],
         )
-        mcp_tools.append((tool, schema["func"]))
-
-    return mcp_tools
+        for defn in TOOL_DEFINITIONS
+    ]
 
 
 def create_server():
@@ -285,18 +100,21 @@ def create_server():
             return [
                 TextContent(
                     type="text",
-                    text=json.dumps({"error": f"Unknown tool: {name}"}),
+                    text=dumps_compact({"error": f"Unknown tool: {name}"}),
                 )
             ]
 
         try:
-            result = handler(**arguments)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+            # Meshy handlers block while polling; run them off the event loop
+            # so concurrent tool calls overlap.
+            result = await asyncio.to_thread(handler, **arguments)
+            # Meshy tools return plain JSON; report anything else as an error
+            return [TextContent(type="text", text=dumps_compact(result, strict=True))]
         except Exception as e:
             return [
                 TextContent(
                     type="text",
-                    text=json.dumps({"error": str(e)}, indent=2),
+                    text=dumps_compact({"error": str(e)}),
                 )
             ]
 
@@ -309,8 +127,6 @@ def run_server(server=None):
     Args:
         server: Optional server instance (creates one if not provided)
     """
-    import asyncio
-
     try:
         from mcp.server.stdio import stdio_server
     except ImportError as e:
@@ -62,7 +62,7 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationRecord:
     """Record of a 3D asset generation."""
 
@@ -80,7 +80,7 @@ class GenerationRecord:
     updated_at: datetime = field(default_factory=_utc_now)
 
 
-@dataclass
+@dataclass(slots=True)
 class SimilarityResult:
     """Result from similarity search."""
 
@@ -28,7 +28,7 @@ def create(request: RetextureRequest) -> str:
 def get(task_id: str) -> RetextureResult:
     """Get task status."""
     response = base.request("GET", f"retexture/{task_id}", version="v1")
-    return RetextureResult(**response.json())
+    return RetextureResult.model_validate_json(response.content)
 
 
 def poll(task_id: str, interval: float = 5.0, timeout: float = 600.0) -> RetextureResult:
@@ -28,7 +28,7 @@ def create(request: RiggingRequest) -> str:
 def get(task_id: str) -> RiggingResult:
     """Get task status."""
     response = base.request("GET", f"rigging/{task_id}", version="v1")
-    return RiggingResult(**response.json())
+    return RiggingResult.model_validate_json(response.content)
 
 
 def poll(task_id: str, interval: float = 5.0, timeout: float = 600.0) -> RiggingResult:
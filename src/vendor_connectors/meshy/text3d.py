@@ -29,7 +29,7 @@ def create(request: Text3DRequest) -> str:
 def get(task_id: str) -> Text3DResult:
     """Get task status."""
     response = base.request("GET", f"text-to-3d/{task_id}", version="v2")
-    return Text3DResult(**response.json())
+    return Text3DResult.model_validate_json(response.content)
 
 
 def refine(task_id: str) -> str:
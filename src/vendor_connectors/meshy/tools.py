@@ -7,10 +7,64 @@ with native wrappers for each supported framework.
 
 from __future__ import annotations
 
-from typing import Any
+import functools
+import itertools
+import os
+import threading
+import time
+import warnings
+from typing import TYPE_CHECKING, Any, Callable
 
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from vendor_connectors.meshy.animations import AnimationMeta
+
+# Upper bound on Meshy tool calls running at once. Agent frameworks may execute
+# several tool calls from one model turn in parallel; each call can hold a
+# generation task open for minutes, so unbounded fan-out just trades 429s for
+# retries. Overridable with MESHY_MAX_CONCURRENCY, read on the first tool call.
+DEFAULT_MAX_CONCURRENCY = 5
+
+
+def _max_concurrency() -> int:
+    """Read MESHY_MAX_CONCURRENCY, falling back to the default on bad values."""
+    raw = os.getenv("MESHY_MAX_CONCURRENCY")
+    if raw is None:
+        return DEFAULT_MAX_CONCURRENCY
+    try:
+        value = int(raw)
+    except ValueError:
+        warnings.warn(
+            f"Ignoring non-integer MESHY_MAX_CONCURRENCY={raw!r}; using {DEFAULT_MAX_CONCURRENCY}",
+            stacklevel=2,
+        )
+        return DEFAULT_MAX_CONCURRENCY
+    if value < 1:
+        warnings.warn(f"MESHY_MAX_CONCURRENCY must be at least 1, got {value}; using 1", stacklevel=2)
+        return 1
+    return value
+
+
+@functools.cache
+def _tool_semaphore() -> threading.BoundedSemaphore:
+    """Return the semaphore shared by every wrapped Meshy tool."""
+    return threading.BoundedSemaphore(_max_concurrency())
+
+
+def _bounded(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a tool function so it holds a shared concurrency slot while running."""
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with _tool_semaphore():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
 # =============================================================================
 # Pydantic Schemas for Tool Inputs
 # =============================================================================
@@ -23,6 +77,7 @@ class Text3dGenerateSchema(BaseModel):
     art_style: str = Field(
         "realistic",
         description="One of: realistic, sculpture. For 'sculpture', set enable_pbr=False.",
+        json_schema_extra={"enum": ["realistic", "sculpture"]},
     )
     negative_prompt: str = Field("", description="Things to avoid in the generation")
     target_polycount: int = Field(30000, description="Target polygon count")
@@ -32,11 +87,24 @@ class Text3dGenerateSchema(BaseModel):
     )
 
 
+class Text3dGenerateBatchSchema(BaseModel):
+    """Pydantic schema for the text3d_generate_batch tool."""
+
+    requests: list[Text3dGenerateSchema] = Field(
+        ...,
+        description="One entry per model to generate, each with the same fields as text3d_generate",
+    )
+
+
 class Image3dGenerateSchema(BaseModel):
     """Pydantic schema for the image3d_generate tool."""
 
     image_url: str = Field(..., description="URL to the source image")
-    topology: str = Field("", description='Mesh topology ("quad" or "triangle"), empty for default')
+    topology: str = Field(
+        "",
+        description='Mesh topology ("quad" or "triangle"), empty for default',
+        json_schema_extra={"enum": ["", "quad", "triangle"]},
+    )
     target_polycount: int = Field(15000, description="Target polygon count")
     enable_pbr: bool = Field(True, description="Enable PBR materials")
 
@@ -78,7 +146,8 @@ class CheckTaskStatusSchema(BaseModel):
     task_id: str = Field(..., description="The Meshy task ID")
     task_type: str = Field(
         "text-to-3d",
-        description="Task type (text-to-3d, rigging, animation, retexture)",
+        description="Task type (text-to-3d, image-to-3d, rigging, animation, retexture)",
+        json_schema_extra={"enum": ["text-to-3d", "image-to-3d", "rigging", "animation", "retexture"]},
     )
 
 
@@ -93,6 +162,17 @@ class GetAnimationSchema(BaseModel):
 # =============================================================================
 
 
+def _status_value(status: object) -> str:
+    """Return the wire value of a task status.
+
+    TaskStatus is a ``str`` enum, but ``str()`` on a member yields
+    ``"TaskStatus.SUCCEEDED"``, so read ``.value`` and only fall back to
+    ``str()`` for plain values.
+    """
+    value = getattr(status, "value", None)
+    return value if value is not None else str(status)
+
+
 def _extract_result_fields(result: object) -> dict[str, object]:
     """Extract common fields from Meshy API result objects.
 
@@ -105,11 +185,7 @@ def _extract_result_fields(result: object) -> dict[str, object]:
     Returns:
         Dict with status, model_url, and thumbnail_url fields
     """
-    # Extract status - prefer .value if it's an enum, otherwise str()
-    if hasattr(result, "status"):
-        status = getattr(result.status, "value", str(result.status))
-    else:
-        status = "unknown"
+    status = _status_value(result.status) if hasattr(result, "status") else "unknown"
 
     # Extract model_url from model_urls.glb if available
     model_url = None
@@ -165,6 +241,78 @@ def text3d_generate(
     }
 
 
+def text3d_generate_batch(
+    requests: list[dict[str, Any]],
+    poll_interval: float = 5.0,
+    timeout: float = 600.0,
+) -> list[dict[str, Any]]:
+    """Generate several 3D models from text in a single tool call.
+
+    Every task is submitted before any is waited on, and pending tasks are
+    then polled round-robin, so N generations take roughly as long as the
+    slowest one instead of the sum of all of them. All calls go through the
+    shared per-key rate limiter.
+
+    Args:
+        requests: One dict per model with text3d_generate's arguments
+        poll_interval: Seconds between polling rounds
+        timeout: Seconds to wait for all tasks before giving up
+
+    Returns:
+        One dict per request, in order, with task_id, status, model_url, and
+        thumbnail_url. Failed, expired, or timed-out tasks include an error.
+        Errors are reported per task: a request that could not be submitted
+        has task_id None and status ERROR, and a task whose status could not
+        be fetched has status ERROR, without affecting the other tasks.
+    """
+    from vendor_connectors.meshy import text3d
+    from vendor_connectors.meshy.models import TaskStatus
+
+    def error_result(task_id: str | None, error: str, status: str = "ERROR") -> dict[str, Any]:
+        return {"task_id": task_id, "status": status, "model_url": None, "thumbnail_url": None, "error": error}
+
+    # Per-request slot: a submitted task ID, or the error result if submission failed
+    slots: list[str | dict[str, Any]] = []
+    for params in requests:
+        params = dict(params.model_dump() if isinstance(params, BaseModel) else params)
+        try:
+            prompt = params.pop("prompt")
+            params.setdefault("target_polycount", 30000)
+            submitted = text3d.generate(prompt, wait=False, **params)
+            slots.append(submitted if isinstance(submitted, str) else submitted.id)
+        except Exception as e:
+            slots.append(error_result(None, f"Submission failed: {e}"))
+
+    results: dict[str, dict[str, Any]] = {}
+    pending = [slot for slot in slots if isinstance(slot, str)]
+    deadline = time.monotonic() + timeout
+    while pending:
+        for task_id in list(pending):
+            try:
+                result = text3d.get(task_id)
+            except Exception as e:
+                results[task_id] = error_result(task_id, f"Status check failed: {e}")
+                pending.remove(task_id)
+                continue
+            if result.status in (TaskStatus.PENDING, TaskStatus.IN_PROGRESS):
+                continue
+            fields = _extract_result_fields(result)
+            if result.status != TaskStatus.SUCCEEDED:
+                fields["error"] = getattr(result, "error", None) or f"Task {str(fields['status']).lower()}"
+            results[task_id] = {"task_id": task_id, **fields}
+            pending.remove(task_id)
+
+        if not pending:
+            break
+        if time.monotonic() > deadline:
+            for task_id in pending:
+                results[task_id] = error_result(task_id, f"Task timed out after {timeout}s", status="TIMEOUT")
+            break
+        time.sleep(poll_interval)
+
+    return [results[slot] if isinstance(slot, str) else slot for slot in slots]
+
+
 def image3d_generate(
     image_url: str,
     topology: str = "",
@@ -216,7 +364,7 @@ def rig_model(model_id: str, wait: bool = True) -> dict[str, Any]:
     if wait:
         return {
             "task_id": result.id,
-            "status": result.status.value if hasattr(result.status, "value") else str(result.status),
+            "status": _status_value(result.status),
             "message": "Rigging completed",
         }
 
@@ -245,7 +393,7 @@ def apply_animation(model_id: str, animation_id: int, wait: bool = True) -> dict
     if wait:
         return {
             "task_id": result.id,
-            "status": result.status.value if hasattr(result.status, "value") else str(result.status),
+            "status": _status_value(result.status),
             "message": "Animation completed",
             "glb_url": result.animation_glb_url,
         }
@@ -286,7 +434,7 @@ def retexture_model(
     if wait:
         return {
             "task_id": result.id,
-            "status": result.status.value if hasattr(result.status, "value") else str(result.status),
+            "status": _status_value(result.status),
             "message": "Retexture completed",
             "model_url": getattr(result, "model_url", None),
         }
@@ -310,25 +458,32 @@ def list_animations(category: str = "", limit: int = 50) -> dict[str, Any]:
     """
     from vendor_connectors.meshy.animations import ANIMATIONS
 
-    animations = list(ANIMATIONS.values())
-
+    # A negative limit returns nothing, whether or not a category is given
+    limit = max(limit, 0)
+    page: Iterable[AnimationMeta]
     if category:
-        animations = [a for a in animations if category.lower() in a.category.lower()]
-
-    results = []
-    for anim in animations[:limit]:
-        results.append(
-            {
-                "id": anim.id,
-                "name": anim.name,
-                "category": anim.category,
-                "subcategory": anim.subcategory,
-            }
-        )
+        needle = category.lower()
+        matches = [a for a in ANIMATIONS.values() if needle in a.category.lower()]
+        total = len(matches)
+        page = matches[:limit]
+    else:
+        # Unfiltered listing: read just the first page instead of copying the catalog
+        total = len(ANIMATIONS)
+        page = itertools.islice(ANIMATIONS.values(), limit)
+
+    results = [
+        {
+            "id": anim.id,
+            "name": anim.name,
+            "category": anim.category,
+            "subcategory": anim.subcategory,
+        }
+        for anim in page
+    ]
 
     return {
         "count": len(results),
-        "total": len(animations),
+        "total": total,
         "animations": results,
     }
 
@@ -359,7 +514,7 @@ def check_task_status(task_id: str, task_type: str = "text-to-3d") -> dict[str,
         raise ValueError(f"Unknown task type: {task_type}")
 
     result = get_func(task_id)
-    status = result.status.value if hasattr(result.status, "value") else str(result.status)
+    status = _status_value(result.status)
 
     # Get model URL if available
     model_url = None
@@ -406,7 +561,7 @@ def get_animation(animation_id: int) -> dict[str, Any]:
 # =============================================================================
 
 # Tool definitions with metadata for all frameworks
-TOOL_DEFINITIONS = [
+TOOL_DEFINITIONS: list[dict[str, Any]] = [
     {
         "func": text3d_generate,
         "name": "text3d_generate",
@@ -417,6 +572,16 @@ TOOL_DEFINITIONS = [
         ),
         "schema": Text3dGenerateSchema,
     },
+    {
+        "func": text3d_generate_batch,
+        "name": "text3d_generate_batch",
+        "description": (
+            "Generate several 3D GLB models from text descriptions in one call using "
+            "Meshy AI. Prefer this over repeated text3d_generate calls when asked for "
+            "multiple models or variants. Returns one result per request, in order."
+        ),
+        "schema": Text3dGenerateBatchSchema,
+    },
     {
         "func": image3d_generate,
         "name": "image3d_generate",
@@ -494,6 +659,9 @@ TOOL_DEFINITIONS = [
 def get_langchain_tools() -> list[Any]:
     """Get all Meshy tools as LangChain StructuredTools.
 
+    At most MESHY_MAX_CONCURRENCY (default 5) tool calls run at once, whether
+    invoked synchronously or via ``ainvoke``.
+
     Returns:
         List of LangChain StructuredTool objects for Meshy operations.
 
@@ -509,7 +677,7 @@ def get_langchain_tools() -> list[Any]:
 
     return [
         StructuredTool.from_function(
-            func=defn["func"],
+            func=_bounded(defn["func"]),
             name=defn["name"],
             description=defn["description"],
             args_schema=defn.get("schema") or defn.get("args_schema"),
@@ -537,7 +705,7 @@ def get_crewai_tools() -> list[Any]:
     tools = []
     for defn in TOOL_DEFINITIONS:
         # Apply @tool decorator with the function name
-        wrapped = crewai_tool(defn["name"])(defn["func"])
+        wrapped = crewai_tool(defn["name"])(_bounded(defn["func"]))
         wrapped.description = defn["description"]
         schema = defn.get("schema") or defn.get("args_schema")
         if schema:
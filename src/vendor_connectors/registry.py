@@ -21,6 +21,10 @@ Usage:
     # Use it
     sources = connector.list_sources()
 
+    # Optionally import connectors at app startup so the first request
+    # does not pay the import cost
+    preload_connectors(['jules', 'github'])
+
 Entry Points (in pyproject.toml):
     [project.entry-points."vendor_connectors.connectors"]
     jules = "vendor_connectors.google.jules:JulesConnector"
@@ -30,86 +34,148 @@ Entry Points (in pyproject.toml):
 
 from __future__ import annotations
 
+import functools
+import importlib
 import sys
+import threading
+import warnings
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Type
 
 if TYPE_CHECKING:
     from vendor_connectors.base import VendorConnectorBase
 
-# Cache for discovered connectors
+# Cache for discovered connectors. The dict is built once and never mutated
+# afterwards; it is only ever replaced wholesale, so readers need no lock.
 _connector_cache: dict[str, Type[VendorConnectorBase]] | None = None
+_discovery_lock = threading.Lock()
+
+# Built-in connectors that may not be in entry points yet
+# (for development/transition period): name -> (module path, class name)
+_BUILTIN_CONNECTORS: dict[str, tuple[str, str]] = {
+    # Google connectors
+    "jules": ("vendor_connectors.google.jules", "JulesConnector"),
+    "google": ("vendor_connectors.google", "GoogleConnector"),
+    "google_cloud": ("vendor_connectors.google", "GoogleCloudConnector"),
+    "google_workspace": ("vendor_connectors.google", "GoogleWorkspaceConnector"),
+    "google_billing": ("vendor_connectors.google", "GoogleBillingConnector"),
+    # Other connectors
+    "cursor": ("vendor_connectors.cursor", "CursorConnector"),
+    "github": ("vendor_connectors.github", "GithubConnector"),
+    "meshy": ("vendor_connectors.meshy", "MeshyConnector"),
+    "anthropic": ("vendor_connectors.anthropic", "AnthropicConnector"),
+    "aws": ("vendor_connectors.aws", "AWSConnector"),
+    "slack": ("vendor_connectors.slack", "SlackConnector"),
+    "zoom": ("vendor_connectors.zoom", "ZoomConnector"),
+    "vault": ("vendor_connectors.vault", "VaultConnector"),
+}
 
 
 def _discover_connectors() -> dict[str, Type[VendorConnectorBase]]:
     """Discover all registered connectors via entry points."""
     global _connector_cache
 
-    if _connector_cache is not None:
+    cache = _connector_cache
+    if cache is not None:
+        return cache
+
+    with _discovery_lock:
+        if _connector_cache is None:
+            _connector_cache = _load_connectors()
         return _connector_cache
 
+
+def _load_connectors() -> dict[str, Type[VendorConnectorBase]]:
+    """Import every connector from entry points and built-ins."""
     connectors: dict[str, Type[VendorConnectorBase]] = {}
 
+    for ep in _connector_entry_points():
+        cls = _load_entry_point(ep)
+        if cls is not None:
+            connectors[ep.name] = cls
+
+    # Also include built-in connectors not yet in entry points
+    # (for development/transition period)
+    _register_builtins(connectors)
+
+    return connectors
+
+
+def _connector_entry_points() -> Iterable[Any]:
+    """Return the entry points registered for vendor connectors."""
     # Python 3.10+ uses importlib.metadata
     if sys.version_info >= (3, 10):
         from importlib.metadata import entry_points
 
-        eps = entry_points(group="vendor_connectors.connectors")
-    else:
-        # Fallback for older Python
-        from importlib.metadata import entry_points as _entry_points
+        return entry_points(group="vendor_connectors.connectors")
 
-        all_eps = _entry_points()
-        eps = all_eps.get("vendor_connectors.connectors", [])
+    # Fallback for older Python
+    from importlib.metadata import entry_points as _entry_points
 
-    for ep in eps:
-        try:
-            connectors[ep.name] = ep.load()
-        except Exception as e:
-            # Log but don't fail - allow partial loading
-            import warnings
+    all_eps = _entry_points()
+    return all_eps.get("vendor_connectors.connectors", [])
 
-            warnings.warn(f"Failed to load connector '{ep.name}': {e}", stacklevel=2)
 
-    # Also include built-in connectors not yet in entry points
-    # (for development/transition period)
-    _register_builtins(connectors)
+def _load_entry_point(ep: Any) -> Type[VendorConnectorBase] | None:
+    """Load a connector entry point, warning instead of failing."""
+    try:
+        cls: Type[VendorConnectorBase] = ep.load()
+        return cls
+    except Exception as e:
+        # Log but don't fail - allow partial loading
+        warnings.warn(f"Failed to load connector '{ep.name}': {e}", stacklevel=3)
+        return None
 
-    _connector_cache = connectors
-    return connectors
+
+def _import_builtin(name: str) -> Type[VendorConnectorBase] | None:
+    """Import a built-in connector, or return None if its extra is missing."""
+    if name not in _BUILTIN_CONNECTORS:
+        return None
+
+    module_path, class_name = _BUILTIN_CONNECTORS[name]
+    try:
+        module = importlib.import_module(module_path)
+    except (ImportError, AttributeError):
+        return None  # Optional dependency not installed
+    return getattr(module, class_name, None)
 
 
 def _register_builtins(connectors: dict[str, Type[VendorConnectorBase]]) -> None:
     """Register built-in connectors that may not be in entry points yet."""
-    builtins = {
-        # Google connectors
-        "jules": ("vendor_connectors.google.jules", "JulesConnector"),
-        "google": ("vendor_connectors.google", "GoogleConnector"),
-        "google_cloud": ("vendor_connectors.google", "GoogleCloudConnector"),
-        "google_workspace": ("vendor_connectors.google", "GoogleWorkspaceConnector"),
-        "google_billing": ("vendor_connectors.google", "GoogleBillingConnector"),
-        # Other connectors
-        "cursor": ("vendor_connectors.cursor", "CursorConnector"),
-        "github": ("vendor_connectors.github", "GithubConnector"),
-        "meshy": ("vendor_connectors.meshy", "MeshyConnector"),
-        "anthropic": ("vendor_connectors.anthropic", "AnthropicConnector"),
-        "aws": ("vendor_connectors.aws", "AWSConnector"),
-        "slack": ("vendor_connectors.slack", "SlackConnector"),
-        "zoom": ("vendor_connectors.zoom", "ZoomConnector"),
-        "vault": ("vendor_connectors.vault", "VaultConnector"),
-    }
-
-    for name, (module_path, class_name) in builtins.items():
+    for name in _BUILTIN_CONNECTORS:
         if name in connectors:
             continue  # Entry point takes precedence
-        try:
-            import importlib
+        cls = _import_builtin(name)
+        if cls is not None:
+            connectors[name] = cls
+
+
+class _ConnectorNotFound(LookupError):
+    """Raised by _resolve_connector for names that don't resolve to a connector."""
 
-            module = importlib.import_module(module_path)
-            cls = getattr(module, class_name, None)
+
+@functools.cache
+def _resolve_connector(name: str) -> Type[VendorConnectorBase]:
+    """Import a single connector by name without loading all the others.
+
+    Unknown names raise instead of returning None because functools.cache
+    doesn't store exceptions, so arbitrary names (e.g. from MCP input) never
+    accumulate in the cache.
+
+    Raises:
+        _ConnectorNotFound: If no connector with this name can be imported.
+    """
+    for ep in _connector_entry_points():
+        if ep.name == name:
+            cls = _load_entry_point(ep)
             if cls is not None:
-                connectors[name] = cls
-        except (ImportError, AttributeError):
-            pass  # Optional dependency not installed
+                return cls
+            break
+    cls = _import_builtin(name)
+    if cls is None:
+        raise _ConnectorNotFound(name)
+    return cls
 
 
 def list_connectors() -> dict[str, Type[VendorConnectorBase]]:
@@ -121,6 +187,18 @@ def list_connectors() -> dict[str, Type[VendorConnectorBase]]:
     return _discover_connectors().copy()
 
 
+def get_connectors_view() -> Mapping[str, Type[VendorConnectorBase]]:
+    """Get a read-only view of all available connectors without copying.
+
+    The view is a snapshot: connectors discovered after clear_cache() are
+    not reflected in it. Use list_connectors() for a dict you can modify.
+
+    Returns:
+        Read-only mapping of connector name to connector class.
+    """
+    return MappingProxyType(_discover_connectors())
+
+
 def get_connector_class(name: str) -> Type[VendorConnectorBase]:
     """Get a connector class by name.
 
@@ -133,14 +211,24 @@ def get_connector_class(name: str) -> Type[VendorConnectorBase]:
     Raises:
         ValueError: If connector not found.
     """
-    connectors = _discover_connectors()
     name_lower = name.lower()
 
-    if name_lower not in connectors:
-        available = ", ".join(sorted(connectors.keys()))
+    # Until something needs the full listing, import only the requested
+    # connector; its class is cached after the first lookup.
+    cache = _connector_cache
+    if cache is not None:
+        cls = cache.get(name_lower)
+    else:
+        try:
+            cls = _resolve_connector(name_lower)
+        except _ConnectorNotFound:
+            cls = None
+
+    if cls is None:
+        available = ", ".join(sorted(_discover_connectors().keys()))
         raise ValueError(f"Unknown connector: {name}. Available: {available}")
 
-    return connectors[name_lower]
+    return cls
 
 
 def get_connector(name: str, **kwargs: Any) -> VendorConnectorBase:
@@ -164,10 +252,31 @@ def get_connector(name: str, **kwargs: Any) -> VendorConnectorBase:
     return cls(**kwargs)
 
 
+def preload_connectors(names: Iterable[str] | None = None) -> None:
+    """Import connectors ahead of first use, e.g. at application startup.
+
+    Args:
+        names: Connector names to import. Imports every available connector
+            if not given.
+
+    Raises:
+        ValueError: If a named connector is not found.
+    """
+    if names is None:
+        _discover_connectors()
+        return
+
+    for name in names:
+        get_connector_class(name)
+
+
 def clear_cache() -> None:
     """Clear the connector cache (useful for testing)."""
     global _connector_cache
-    _connector_cache = None
+
+    with _discovery_lock:
+        _connector_cache = None
+        _resolve_connector.cache_clear()
 
 
 # =============================================================================
@@ -195,4 +304,4 @@ def get_connector_info(name: str) -> dict[str, Any]:
 
 def list_connector_info() -> list[dict[str, Any]]:
     """Get metadata for all connectors."""
-    return [get_connector_info(name) for name in sorted(list_connectors().keys())]
+    return [get_connector_info(name) for name in sorted(get_connectors_view())]
@@ -24,6 +24,7 @@ Usage:
 from __future__ import annotations
 
 import os
+from types import MappingProxyType
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -253,7 +254,7 @@ def get_channel_history(
 # Tool Definitions
 # =============================================================================
 
-TOOL_DEFINITIONS = [
+TOOL_DEFINITIONS: list[dict[str, Any]] = [
     {
         "name": "slack_list_channels",
         "description": "List Slack channels with their properties. Returns channel names, IDs, topics, and member counts.",
@@ -280,6 +281,11 @@ TOOL_DEFINITIONS = [
     },
 ]
 
+# Read-only name -> definition index for dispatching a tool call by name.
+TOOLS_BY_NAME: MappingProxyType[str, dict[str, Any]] = MappingProxyType(
+    {defn["name"]: defn for defn in TOOL_DEFINITIONS}
+)
+
 
 # =============================================================================
 # Framework-Specific Getters
@@ -404,4 +410,5 @@ __all__ = [
     "get_channel_history",
     # Tool metadata
     "TOOL_DEFINITIONS",
+    "TOOLS_BY_NAME",
 ]
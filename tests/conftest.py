@@ -20,6 +20,7 @@ Usage:
 
 from __future__ import annotations
 
+import sys
 from unittest.mock import MagicMock
 
 import pytest
@@ -95,3 +96,12 @@ def base_connector_kwargs(mock_logger):
         "logger": mock_logger,
         "from_environment": False,
     }
+
+
+@pytest.fixture(autouse=True)
+def clear_google_credential_cache():
+    """Keep cached Google credentials from leaking between tests."""
+    yield
+    google = sys.modules.get("vendor_connectors.google")
+    if google is not None:
+        google.clear_credential_cache()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import os
 import tempfile
 from pathlib import Path
@@ -53,6 +54,7 @@ def mock_response():
         response = MagicMock(spec=httpx.Response)
         response.status_code = status_code
         response.json.return_value = json_data or {}
+        response.content = json.dumps(json_data or {}).encode()
         response.headers = headers or {}
         response.raise_for_status = MagicMock()
         if status_code >= 400:
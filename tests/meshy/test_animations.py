@@ -0,0 +1,59 @@
+"""Tests for the Meshy animation library lookups."""
+
+from __future__ import annotations
+
+import pytest
+
+from vendor_connectors.meshy.animations import (
+    ANIMATIONS,
+    AnimationCategory,
+    AnimationSubcategory,
+    GameAnimationSet,
+    get_animations_by_category,
+    get_animations_by_subcategory,
+)
+
+
+class TestAnimationLookups:
+    """Tests for category and subcategory lookups."""
+
+    @pytest.mark.parametrize("category", list(AnimationCategory))
+    def test_by_category_matches_scan(self, category):
+        """Indexed lookups return the same animations, in order, as a full scan."""
+        expected = [anim for anim in ANIMATIONS.values() if anim.category == category.value]
+
+        assert get_animations_by_category(category) == expected
+
+    @pytest.mark.parametrize("subcategory", list(AnimationSubcategory))
+    def test_by_subcategory_matches_scan(self, subcategory):
+        """Indexed lookups return the same animations, in order, as a full scan."""
+        expected = [anim for anim in ANIMATIONS.values() if anim.subcategory == subcategory.value]
+
+        assert get_animations_by_subcategory(subcategory) == expected
+
+    def test_result_is_a_copy(self):
+        """Callers may mutate the returned list without touching the index."""
+        first = get_animations_by_category(AnimationCategory.FIGHTING)
+        first.clear()
+
+        assert get_animations_by_category(AnimationCategory.FIGHTING)
+
+
+class TestGameAnimationSet:
+    """Tests for the curated animation sets."""
+
+    @pytest.mark.parametrize(
+        ("name", "field", "values"),
+        [
+            ("BASIC_MOVEMENT", "subcategory", ("Idle", "Walking", "Running")),
+            ("COMBAT", "category", ("Fighting",)),
+            ("SOCIAL", "subcategory", ("Interacting",)),
+            ("CELEBRATION", "category", ("Dancing",)),
+            ("EXPLORATION", "subcategory", ("LookingAround", "Idle")),
+        ],
+    )
+    def test_sets_hold_lowest_matching_ids(self, name, field, values):
+        """Each set holds the ten lowest IDs matching its filter."""
+        expected = sorted(aid for aid, anim in ANIMATIONS.items() if getattr(anim, field) in values)[:10]
+
+        assert getattr(GameAnimationSet, name) == expected
@@ -0,0 +1,228 @@
+"""Tests for Meshy base HTTP client, pooling and rate limiting."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from vendor_connectors.meshy import base
+from vendor_connectors.meshy.base import RateLimiter
+
+
+@pytest.fixture(autouse=True)
+def reset_limiters():
+    """Isolate the per-API-key limiter cache between tests."""
+    with patch.dict(base._limiters, clear=True):
+        yield
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_admits_requests_within_rpm(self):
+        """Requests under the RPM budget are admitted without sleeping."""
+        limiter = RateLimiter(rpm=3)
+
+        with patch("vendor_connectors.meshy.base.time.sleep") as mock_sleep:
+            for _ in range(3):
+                limiter.acquire()
+
+        mock_sleep.assert_not_called()
+
+    @patch("vendor_connectors.meshy.base.time.sleep")
+    @patch("vendor_connectors.meshy.base.time.monotonic", side_effect=[0.0, 1.0, 2.0, 61.0])
+    def test_blocks_when_rpm_exhausted(self, _mock_monotonic, mock_sleep):
+        """The request after the RPM budget waits for the window to slide."""
+        limiter = RateLimiter(rpm=2, window=60.0)
+
+        limiter.acquire()
+        limiter.acquire()
+        limiter.acquire()
+
+        mock_sleep.assert_called_once_with(58.0)
+
+    @patch("vendor_connectors.meshy.base.time.sleep")
+    @patch("vendor_connectors.meshy.base.time.monotonic", side_effect=[0.0, 10.0, 20.0, 60.0])
+    def test_blocks_when_tpm_exhausted(self, _mock_monotonic, mock_sleep):
+        """Token budget is enforced independently of the request budget."""
+        limiter = RateLimiter(rpm=100, tpm=100, window=60.0)
+
+        limiter.acquire(60)
+        limiter.acquire(30)
+        limiter.acquire(50)
+
+        mock_sleep.assert_called_once_with(40.0)
+
+    def test_uses_slots(self):
+        """Limiters carry no per-instance __dict__."""
+        limiter = RateLimiter(rpm=10, tpm=100, max_concurrency=2)
+
+        assert not hasattr(limiter, "__dict__")
+        with pytest.raises(AttributeError):
+            limiter.unexpected = True
+
+    def test_concurrency_slots(self):
+        """The context manager reserves and releases an in-flight slot."""
+        limiter = RateLimiter(rpm=10, max_concurrency=1)
+
+        with limiter:
+            assert limiter._semaphore.acquire(blocking=False) is False
+
+        assert limiter._semaphore.acquire(blocking=False) is True
+
+
+class TestAdaptiveBudget:
+    """Tests for AIMD adjustment of the request budget."""
+
+    def test_limit_halves_and_success_restores(self):
+        """A 429 shrinks the budget multiplicatively; successes grow it back additively."""
+        limiter = RateLimiter(rpm=10, alpha=2.0, beta=0.5)
+
+        limiter.on_limit()
+        assert limiter.effective_rpm == 5.0
+        limiter.on_limit()
+        assert limiter.effective_rpm == 2.5
+
+        for _ in range(10):
+            limiter.on_success()
+        assert limiter.effective_rpm == 10.0
+
+    def test_budget_never_drops_below_one(self):
+        """Repeated limits keep at least one request per window."""
+        limiter = RateLimiter(rpm=4, beta=0.1)
+
+        for _ in range(5):
+            limiter.on_limit()
+
+        assert limiter.effective_rpm == 1.0
+
+    @patch("vendor_connectors.meshy.base.time.sleep")
+    @patch("vendor_connectors.meshy.base.time.monotonic", side_effect=[0.0, 1.0, 2.0, 61.0])
+    def test_reduced_budget_is_enforced(self, _mock_monotonic, mock_sleep):
+        """After a limit, fewer requests are admitted per window."""
+        limiter = RateLimiter(rpm=4, window=60.0)
+
+        limiter.acquire()
+        limiter.acquire()
+        limiter.on_limit()
+        limiter.acquire()
+
+        mock_sleep.assert_called_once_with(58.0)
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    def test_delta_seconds(self):
+        """Numeric values are seconds."""
+        assert base.parse_retry_after("12") == 12.0
+
+    @patch("vendor_connectors.meshy.base.time.time", return_value=1_700_000_000.0)
+    def test_http_date(self, _mock_time):
+        """HTTP dates are converted to seconds from now."""
+        assert base.parse_retry_after("Tue, 14 Nov 2023 22:13:50 GMT") == 30.0
+
+    def test_missing_or_invalid_uses_default(self):
+        """Missing or garbage values fall back to the default."""
+        assert base.parse_retry_after(None) == 5.0
+        assert base.parse_retry_after("soon", default=2.0) == 2.0
+
+
+class TestRateLimiterRegistry:
+    """Tests for the shared per-key limiter."""
+
+    def test_one_limiter_per_api_key(self):
+        """The same API key reuses one limiter; a new key gets its own."""
+        with patch("vendor_connectors.meshy.base.get_api_key", return_value="key-a"):
+            first = base.get_rate_limiter()
+            second = base.get_rate_limiter()
+        with patch("vendor_connectors.meshy.base.get_api_key", return_value="key-b"):
+            other = base.get_rate_limiter()
+
+        assert first is second
+        assert first is not other
+        assert first.rpm == base.PROVIDER_PROFILES["meshy"]["rpm"]
+
+    def test_provider_profile_detected_from_host(self):
+        """The profile is selected from the API host."""
+        assert base.get_provider_profile("https://api.meshy.ai") is base.PROVIDER_PROFILES["meshy"]
+
+    @patch("vendor_connectors.meshy.base.get_api_key", return_value="key")
+    @patch("vendor_connectors.meshy.base._rate_limit")
+    @patch("vendor_connectors.meshy.base.get_client")
+    @patch("vendor_connectors.meshy.base.get_rate_limiter")
+    def test_request_acquires_limiter(self, mock_get_limiter, mock_get_client, _mock_rate_limit, _mock_api_key):
+        """Every API request passes through the shared limiter."""
+        limiter = MagicMock()
+        mock_get_limiter.return_value = limiter
+        response = MagicMock(status_code=200)
+        mock_get_client.return_value.request.return_value = response
+
+        assert base.request("GET", "text-to-3d/abc") is response
+
+        limiter.acquire.assert_called_once_with()
+        limiter.__enter__.assert_called_once()
+        limiter.on_success.assert_called_once_with()
+
+    @patch("vendor_connectors.meshy.base.time.sleep")
+    @patch("vendor_connectors.meshy.base.get_api_key", return_value="key")
+    @patch("vendor_connectors.meshy.base._rate_limit")
+    @patch("vendor_connectors.meshy.base.get_client")
+    @patch("vendor_connectors.meshy.base.get_rate_limiter")
+    def test_rate_limited_response_shrinks_budget(
+        self, mock_get_limiter, mock_get_client, _mock_rate_limit, _mock_api_key, mock_sleep
+    ):
+        """A 429 reports back to the limiter and honours Retry-After."""
+        limiter = MagicMock()
+        mock_get_limiter.return_value = limiter
+        mock_get_client.return_value.request.return_value = MagicMock(status_code=429, headers={"retry-after": "3"})
+
+        with pytest.raises(base.RateLimitError):
+            base.request.__wrapped__("GET", "text-to-3d/abc")
+
+        limiter.on_limit.assert_called_once_with()
+        limiter.on_success.assert_not_called()
+        mock_sleep.assert_called_once_with(3.0)
+
+
+class TestRequestSpacing:
+    """Tests for the module-wide minimum request interval."""
+
+    @patch("vendor_connectors.meshy.base.time.sleep")
+    def test_spacing_uses_module_lock(self, _mock_sleep):
+        """The spacing lock exists from import time and guards every call."""
+        lock = MagicMock()
+
+        with patch.object(base, "_rate_limit_lock", lock):
+            base._rate_limit()
+            base._rate_limit()
+
+        assert lock.__enter__.call_count == 2
+
+
+class TestClient:
+    """Tests for the shared HTTP client."""
+
+    @patch("vendor_connectors.meshy.base.httpx.Client")
+    def test_client_is_shared_and_pooled(self, mock_client_cls):
+        """All callers share one client configured with the pool limits."""
+        with patch.object(base, "_client", None):
+            first = base.get_client()
+            second = base.get_client()
+
+        assert first is second
+        mock_client_cls.assert_called_once_with(timeout=300.0, limits=base.CLIENT_LIMITS)
+
+    def test_download_streams_through_shared_client(self, tmp_path):
+        """Downloads reuse the pooled client and stream to disk."""
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=b"glb-bytes"))
+        output = tmp_path / "nested" / "model.glb"
+
+        with patch.object(base, "_client", httpx.Client(transport=transport)):
+            size = base.download("https://assets.meshy.ai/model.glb", str(output))
+            base.close()
+
+        assert size == len(b"glb-bytes")
+        assert output.read_bytes() == b"glb-bytes"
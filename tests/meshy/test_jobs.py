@@ -39,6 +39,15 @@ class TestAssetManifest:
         assert manifest.intent == "player_character"
         assert manifest.task_id == "task-123"
 
+    def test_manifest_metadata_defaults_to_fresh_dict(self):
+        """Test each manifest gets its own metadata dict."""
+        first = AssetManifest(asset_id="a", intent="prop", description="A", art_style="realistic")
+        second = AssetManifest(asset_id="b", intent="prop", description="B", art_style="realistic")
+
+        first.metadata["slug"] = "a"
+
+        assert second.metadata == {}
+
     def test_manifest_to_dict(self):
         """Test converting manifest to dictionary."""
         manifest = AssetManifest(
@@ -0,0 +1,35 @@
+"""Tests for vendor_connectors.meshy.mcp tool definitions."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("mcp")
+
+from vendor_connectors.meshy import tools  # noqa: E402
+from vendor_connectors.meshy.mcp import _create_mcp_tools  # noqa: E402
+
+
+class TestMcpTools:
+    """Tests for MCP tools built from the shared definitions."""
+
+    def test_matches_tool_definitions(self):
+        """Test MCP exposes the same tools and handlers as TOOL_DEFINITIONS."""
+        mcp_tools = _create_mcp_tools()
+
+        assert [tool.name for tool, _ in mcp_tools] == [defn["name"] for defn in tools.TOOL_DEFINITIONS]
+        handlers = {tool.name: func for tool, func in mcp_tools}
+        for defn in tools.TOOL_DEFINITIONS:
+            assert handlers[defn["name"]] is defn["func"]
+
+    def test_input_schema_keeps_required_and_enums(self):
+        """Test input schemas carry required fields and enum constraints."""
+        # Read through the wire alias: the attribute is inputSchema in mcp 1.x
+        # and input_schema in 2.x.
+        schemas = {tool.name: tool.model_dump(by_alias=True)["inputSchema"] for tool, _ in _create_mcp_tools()}
+
+        text3d = schemas["text3d_generate"]
+        assert text3d["type"] == "object"
+        assert text3d["required"] == ["prompt"]
+        assert text3d["properties"]["art_style"]["enum"] == ["realistic", "sculpture"]
+        assert "image-to-3d" in schemas["check_task_status"]["properties"]["task_type"]["enum"]
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import json
+from unittest.mock import patch
+
+import httpx
 import pytest
 from pydantic import ValidationError
 
@@ -305,3 +309,32 @@ class TestAssetSpec:
             output_path="models/props",
         )
         assert spec.asset_id is None
+
+
+class TestResultParsing:
+    """Tests for parsing API responses straight from JSON bytes."""
+
+    @pytest.mark.parametrize(
+        ("module_name", "endpoint"),
+        [
+            ("text3d", "text-to-3d"),
+            ("image3d", "image-to-3d"),
+            ("rigging", "rigging"),
+            ("animate", "animations"),
+            ("retexture", "retexture"),
+        ],
+    )
+    def test_get_parses_response_content(self, module_name, endpoint):
+        """Test each get() validates the raw response body into its result model."""
+        import importlib
+
+        module = importlib.import_module(f"vendor_connectors.meshy.{module_name}")
+        payload = {"id": "task-1", "status": "SUCCEEDED", "created_at": 1700000000, "progress": 100}
+        response = httpx.Response(200, content=json.dumps(payload).encode())
+
+        with patch("vendor_connectors.meshy.base.request", return_value=response) as mock_request:
+            result = module.get("task-1")
+
+        assert result.id == "task-1"
+        assert result.status == TaskStatus.SUCCEEDED
+        assert mock_request.call_args.args[1].startswith(endpoint)
@@ -7,6 +7,7 @@ since those frameworks are optional dependencies.
 
 from __future__ import annotations
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -14,6 +15,7 @@ import pytest
 # Expected tools list - canonical reference for all Meshy tools
 EXPECTED_MESHY_TOOLS = {
     "text3d_generate",
+    "text3d_generate_batch",
     "image3d_generate",
     "rig_model",
     "apply_animation",
@@ -116,6 +118,127 @@ class TestText3DGenerate:
         assert result["task_id"] == "task_456"
 
 
+class TestText3DGenerateBatch:
+    """Tests for text3d_generate_batch function."""
+
+    @patch("vendor_connectors.meshy.tools.time.sleep")
+    def test_submits_all_before_polling(self, mock_sleep):
+        """Test all tasks are submitted up front and results keep request order."""
+        from vendor_connectors.meshy.models import TaskStatus
+        from vendor_connectors.meshy.tools import text3d_generate_batch
+
+        calls = []
+
+        def fake_generate(prompt, **kwargs):
+            calls.append(("generate", prompt))
+            return f"task_{prompt}"
+
+        def make_result(task_id, status, error=None):
+            result = MagicMock()
+            result.status = status
+            result.error = error
+            result.model_urls.glb = f"https://example.com/{task_id}.glb"
+            result.thumbnail_url = None
+            return result
+
+        responses = {
+            "task_a": [make_result("task_a", TaskStatus.IN_PROGRESS), make_result("task_a", TaskStatus.SUCCEEDED)],
+            "task_b": [make_result("task_b", TaskStatus.FAILED, error="bad prompt")],
+        }
+
+        def fake_get(task_id):
+            calls.append(("get", task_id))
+            return responses[task_id].pop(0)
+
+        with (
+            patch("vendor_connectors.meshy.text3d.generate", side_effect=fake_generate),
+            patch("vendor_connectors.meshy.text3d.get", side_effect=fake_get),
+        ):
+            results = text3d_generate_batch([{"prompt": "a"}, {"prompt": "b", "art_style": "sculpture"}])
+
+        assert calls[:2] == [("generate", "a"), ("generate", "b")]
+        assert [r["task_id"] for r in results] == ["task_a", "task_b"]
+        assert results[0]["status"] == "SUCCEEDED"
+        assert results[0]["model_url"] == "https://example.com/task_a.glb"
+        assert results[1]["status"] == "FAILED"
+        assert results[1]["error"] == "bad prompt"
+        mock_sleep.assert_called_once_with(5.0)
+
+    def _succeeded(self, task_id):
+        from vendor_connectors.meshy.models import TaskStatus
+
+        result = MagicMock()
+        result.status = TaskStatus.SUCCEEDED
+        result.model_urls.glb = f"https://example.com/{task_id}.glb"
+        result.thumbnail_url = None
+        return result
+
+    def test_status_error_is_reported_per_task(self):
+        """Test one task's polling error doesn't discard the other results."""
+        from vendor_connectors.meshy.base import MeshyAPIError
+        from vendor_connectors.meshy.tools import text3d_generate_batch
+
+        def fake_get(task_id):
+            if task_id == "task_b":
+                raise MeshyAPIError("server error")
+            return self._succeeded(task_id)
+
+        with (
+            patch("vendor_connectors.meshy.text3d.generate", side_effect=lambda prompt, **kw: f"task_{prompt}"),
+            patch("vendor_connectors.meshy.text3d.get", side_effect=fake_get),
+        ):
+            results = text3d_generate_batch([{"prompt": "a"}, {"prompt": "b"}])
+
+        assert results[0]["status"] == "SUCCEEDED"
+        assert results[1]["task_id"] == "task_b"
+        assert results[1]["status"] == "ERROR"
+        assert "server error" in results[1]["error"]
+
+    def test_submission_failure_keeps_submitted_tasks(self):
+        """Test a failed submission is reported without orphaning the tasks already submitted."""
+        from vendor_connectors.meshy.base import MeshyAPIError
+        from vendor_connectors.meshy.tools import text3d_generate_batch
+
+        def fake_generate(prompt, **kwargs):
+            if prompt == "b":
+                raise MeshyAPIError("quota exceeded")
+            return f"task_{prompt}"
+
+        with (
+            patch("vendor_connectors.meshy.text3d.generate", side_effect=fake_generate),
+            patch("vendor_connectors.meshy.text3d.get", side_effect=self._succeeded),
+        ):
+            results = text3d_generate_batch([{"prompt": "a"}, {"prompt": "b"}, {"prompt": "c"}])
+
+        assert [r["task_id"] for r in results] == ["task_a", None, "task_c"]
+        assert [r["status"] for r in results] == ["SUCCEEDED", "ERROR", "SUCCEEDED"]
+        assert "quota exceeded" in results[1]["error"]
+
+    @patch("vendor_connectors.meshy.tools.time.sleep")
+    @patch("vendor_connectors.meshy.tools.time.monotonic", side_effect=[0.0, 11.0])
+    def test_timeout_is_reported_per_task(self, _mock_monotonic, _mock_sleep):
+        """Test tasks still running at the deadline are reported as timed out."""
+        from vendor_connectors.meshy.models import TaskStatus
+        from vendor_connectors.meshy.tools import text3d_generate_batch
+
+        running = MagicMock(status=TaskStatus.IN_PROGRESS)
+        with (
+            patch("vendor_connectors.meshy.text3d.generate", return_value="task_a"),
+            patch("vendor_connectors.meshy.text3d.get", return_value=running),
+        ):
+            results = text3d_generate_batch([{"prompt": "a"}], timeout=10.0)
+
+        assert results == [
+            {
+                "task_id": "task_a",
+                "status": "TIMEOUT",
+                "model_url": None,
+                "thumbnail_url": None,
+                "error": "Task timed out after 10.0s",
+            }
+        ]
+
+
 class TestImage3DGenerate:
     """Tests for image3d_generate function."""
 
@@ -303,6 +426,37 @@ class TestListAnimations:
         assert result["count"] == 10
         assert result["total"] == 100
 
+    def test_list_animations_filtered_total_counts_all_matches(self):
+        """Test a category filter reports every match in total, not just the page."""
+        from vendor_connectors.meshy.tools import list_animations
+
+        mock_animations = {}
+        for i in range(20):
+            mock_anim = MagicMock()
+            mock_anim.id = i
+            mock_anim.name = f"Animation_{i}"
+            mock_anim.category = "Fighting" if i % 2 else "Dancing"
+            mock_anim.subcategory = "Test"
+            mock_animations[i] = mock_anim
+
+        with patch("vendor_connectors.meshy.animations.ANIMATIONS", mock_animations):
+            result = list_animations(category="fighting", limit=3)
+
+        assert result["count"] == 3
+        assert result["total"] == 10
+        assert [a["id"] for a in result["animations"]] == [1, 3, 5]
+
+    @pytest.mark.parametrize("category", ["", "fighting"])
+    def test_list_animations_negative_limit_returns_nothing(self, category):
+        """Test a negative limit is clamped to zero with or without a category filter."""
+        from vendor_connectors.meshy.tools import list_animations
+
+        result = list_animations(category=category, limit=-2)
+
+        assert result["count"] == 0
+        assert result["animations"] == []
+        assert result["total"] > 0
+
 
 class TestCheckTaskStatus:
     """Tests for check_task_status function."""
@@ -425,3 +579,68 @@ class TestAutoDetection:
 
         with pytest.raises(ValueError, match="Unknown framework"):
             get_tools("invalid_framework")
+
+
+class TestConcurrencyLimit:
+    """Tests for the shared tool concurrency limit."""
+
+    def test_bounded_holds_slot_while_running(self):
+        """Test wrapped tools hold a semaphore slot for the duration of the call."""
+        from vendor_connectors.meshy import tools as meshy_tools
+
+        semaphore = threading.BoundedSemaphore(1)
+
+        def probe():
+            return semaphore.acquire(blocking=False)
+
+        with patch.object(meshy_tools, "_tool_semaphore", return_value=semaphore):
+            wrapped = meshy_tools._bounded(probe)
+            assert wrapped() is False
+            assert semaphore.acquire(blocking=False) is True
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [(None, 5), ("8", 8), ("1", 1)],
+    )
+    def test_max_concurrency_from_env(self, monkeypatch, raw, expected):
+        """Test MESHY_MAX_CONCURRENCY overrides the default limit."""
+        from vendor_connectors.meshy.tools import _max_concurrency
+
+        if raw is None:
+            monkeypatch.delenv("MESHY_MAX_CONCURRENCY", raising=False)
+        else:
+            monkeypatch.setenv("MESHY_MAX_CONCURRENCY", raw)
+        assert _max_concurrency() == expected
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [("abc", 5), ("0", 1), ("-3", 1)],
+    )
+    def test_max_concurrency_rejects_bad_values(self, monkeypatch, raw, expected):
+        """Test invalid limits warn instead of failing or blocking every call."""
+        from vendor_connectors.meshy.tools import _max_concurrency
+
+        monkeypatch.setenv("MESHY_MAX_CONCURRENCY", raw)
+        with pytest.warns(UserWarning, match="MESHY_MAX_CONCURRENCY"):
+            assert _max_concurrency() == expected
+
+    def test_bounded_preserves_metadata(self):
+        """Test wrapped tools keep the name and docstring frameworks introspect."""
+        from vendor_connectors.meshy.tools import _bounded, text3d_generate
+
+        wrapped = _bounded(text3d_generate)
+        assert wrapped.__name__ == "text3d_generate"
+        assert wrapped.__doc__ == text3d_generate.__doc__
+
+
+class TestStatusValue:
+    """Tests for task status normalization."""
+
+    def test_enum_and_plain_values(self):
+        """Test enum members serialize to their value and plain strings pass through."""
+        from vendor_connectors.meshy.models import TaskStatus
+        from vendor_connectors.meshy.tools import _status_value
+
+        assert _status_value(TaskStatus.SUCCEEDED) == "SUCCEEDED"
+        assert type(_status_value(TaskStatus.SUCCEEDED)) is str
+        assert _status_value("PENDING") == "PENDING"
@@ -0,0 +1,51 @@
+"""Tests for VectorStore generation records."""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import json
+
+import pytest
+
+from vendor_connectors.meshy.persistence.vector_store import GenerationRecord, VectorStore
+
+
+@pytest.fixture
+def vector_store(temp_dir):
+    """Create a VectorStore backed by a temporary database."""
+    store = VectorStore(db_path=temp_dir / "generations.db")
+    yield store
+    store.close()
+
+
+class TestGenerationRecordMetadata:
+    """Tests for record metadata handling."""
+
+    def test_records_without_metadata_get_their_own_dict(self, vector_store):
+        """Test records without metadata get independent, mutable dicts."""
+        vector_store.record_generation(spec_hash="a", prompt="a sword")
+        vector_store.record_generation(spec_hash="b", prompt="a shield")
+
+        first = vector_store.get_by_spec_hash("a")
+        second = vector_store.get_by_spec_hash("b")
+        first.metadata["tag"] = "weapon"
+
+        assert second.metadata == {}
+        assert GenerationRecord().metadata == {}
+
+    def test_record_is_copyable_and_serializable(self):
+        """Test records work with asdict, deepcopy and JSON encoding."""
+        record = GenerationRecord(prompt="a shield")
+
+        assert dataclasses.asdict(record)["metadata"] == {}
+        assert copy.deepcopy(record).metadata == {}
+        assert json.dumps(record.metadata) == "{}"
+
+    def test_metadata_round_trips(self, vector_store):
+        """Test stored metadata is loaded back as a dict."""
+        vector_store.record_generation(spec_hash="c", prompt="a helmet", metadata={"faction": "knights"})
+
+        record = vector_store.get_by_spec_hash("c")
+
+        assert record.metadata == {"faction": "knights"}
@@ -1,9 +1,24 @@
 """Tests for vendor_connectors.ai_tools module."""
 from __future__ import annotations
 
+from typing import Optional
+from unittest.mock import patch
+
+import pytest
 from pydantic import BaseModel, Field
 
 
+def lookup(item_id: str) -> str:
+    """Look up an item."""
+    return item_id
+
+
+class LookupSchema(BaseModel):
+    """Schema adding a description to ``lookup``'s argument."""
+
+    item_id: str = Field(..., description="Item ID")
+
+
 class TestGetPydanticSchema:
     """Tests for get_pydantic_schema function."""
 
@@ -96,3 +111,370 @@ class TestGetPydanticSchema:
                 }
             },
         }
+
+    def test_schema_is_cached_per_model(self):
+        """Test that repeated calls for the same model reuse one schema."""
+        from vendor_connectors.ai_tools import get_pydantic_schema
+
+        class MyTool(BaseModel):
+            """A cached tool."""
+
+            name: str
+
+        with patch.object(MyTool, "model_json_schema", wraps=MyTool.model_json_schema) as mock_schema:
+            first = get_pydantic_schema(MyTool)
+            second = get_pydantic_schema(MyTool)
+
+        assert first == second
+        mock_schema.assert_called_once_with()
+
+    def test_callers_get_independent_copies(self):
+        """Test mutating a returned schema doesn't affect later callers."""
+        from vendor_connectors.ai_tools import get_pydantic_schema
+
+        class MyTool(BaseModel):
+            """A shared tool."""
+
+            name: str
+
+        get_pydantic_schema(MyTool)["properties"]["name"]["type"] = "integer"
+
+        assert get_pydantic_schema(MyTool)["properties"]["name"]["type"] == "string"
+
+
+class TestGetJsonSchemaType:
+    """Tests for annotation to JSON schema type mapping."""
+
+    @pytest.mark.parametrize(
+        ("annotation", "expected"),
+        [
+            (str, "string"),
+            (int, "integer"),
+            (float, "number"),
+            (bool, "boolean"),
+            (list[str], "array"),
+            (dict[str, int], "object"),
+            (Optional[int], "integer"),
+            (int | None, "integer"),
+            (str | int, "string"),
+            ("bool", "boolean"),
+            ("list[str] | None", "array"),
+            ("SomeModel", "string"),
+        ],
+    )
+    def test_mapping(self, annotation, expected):
+        """Test types, generics, optionals and annotation strings."""
+        from vendor_connectors.ai_tools import get_json_schema_type
+
+        assert get_json_schema_type(annotation) == expected
+
+    def test_signature_resolves_postponed_annotations(self):
+        """Test string annotations from ``from __future__ import annotations`` are evaluated."""
+        from vendor_connectors.ai_tools import get_signature_schema_types
+
+        def func(count: int, flags: list[str], label="x") -> None:
+            """Example."""
+
+        assert get_signature_schema_types(func) == {"count": "integer", "flags": "array"}
+
+
+def typed_tool(
+    name: str,
+    count: int,
+    ratio: float,
+    enabled: bool,
+    tags: list[str],
+    extra: dict[str, str],
+    note: str | None = None,
+) -> str:
+    """Take one argument of each JSON schema type."""
+    return name
+
+
+@pytest.fixture(scope="module")
+def typed_tool_definition():
+    """Build the AI tool definition for ``typed_tool`` once for the module."""
+    from vendor_connectors.base import VendorConnectorBase
+
+    connector = VendorConnectorBase(api_key="test", from_environment=False)
+    connector.register_tool(typed_tool)
+    return connector.get_ai_tool_definitions()[0]
+
+
+class TestSignatureToolDefinition:
+    """Tests for tool definitions inferred from a function signature."""
+
+    @pytest.mark.parametrize(
+        ("param", "expected"),
+        [
+            ("name", "string"),
+            ("count", "integer"),
+            ("ratio", "number"),
+            ("enabled", "boolean"),
+            ("tags", "array"),
+            ("extra", "object"),
+            ("note", "string"),
+        ],
+    )
+    def test_parameter_type(self, typed_tool_definition, param, expected):
+        """Test each parameter maps to its JSON schema type."""
+        assert typed_tool_definition["inputSchema"]["properties"][param] == {"type": expected}
+
+    def test_required_excludes_defaults(self, typed_tool_definition):
+        """Test parameters with defaults are optional."""
+        required = typed_tool_definition["inputSchema"]["required"]
+
+        assert required == ["name", "count", "ratio", "enabled", "tags", "extra"]
+
+    def test_name_and_description(self, typed_tool_definition):
+        """Test the name and docstring are carried over."""
+        assert typed_tool_definition["name"] == "typed_tool"
+        assert typed_tool_definition["description"] == "Take one argument of each JSON schema type."
+
+
+class TestConnectorToolDefinitions:
+    """Tests for VendorConnectorBase.get_ai_tool_definitions schema caching."""
+
+    def _connector(self):
+        from vendor_connectors.base import VendorConnectorBase
+
+        return VendorConnectorBase(api_key="test", from_environment=False)
+
+    def test_input_schema_built_once(self):
+        """Test input schemas are built once and handed out as copies."""
+        connector = self._connector()
+
+        def lookup(item_id: int, verbose: bool = False) -> str:
+            """Look up an item."""
+            return str(item_id)
+
+        connector.register_tool(lookup)
+        with patch.object(connector, "_build_input_schema", wraps=connector._build_input_schema) as mock_build:
+            first = connector.get_ai_tool_definitions()[0]["inputSchema"]
+            first["properties"]["item_id"]["type"] = "string"
+            second = connector.get_ai_tool_definitions()[0]["inputSchema"]
+
+        mock_build.assert_called_once()
+        assert second == {
+            "type": "object",
+            "properties": {"item_id": {"type": "integer"}, "verbose": {"type": "boolean"}},
+            "required": ["item_id"],
+        }
+
+    def test_reregistering_tool_rebuilds_schema(self):
+        """Test registering a tool again invalidates its cached schema."""
+        connector = self._connector()
+
+        connector.register_tool(lookup)
+        connector.get_ai_tool_definitions()
+        connector.register_tool(lookup, schema=LookupSchema)
+
+        schema = connector.get_ai_tool_definitions()[0]["inputSchema"]
+        assert schema["properties"]["item_id"]["description"] == "Item ID"
+
+    def test_langchain_tools_built_once(self):
+        """Test LangChain wrappers are reused until the tool is registered again."""
+        pytest.importorskip("langchain_core")
+        connector = self._connector()
+
+        connector.register_tool(lookup)
+        first = connector.get_tools()[0]
+        assert connector.get_tools()[0] is first
+
+        connector.register_tool(lookup, description="Find an item.")
+        assert connector.get_tools()[0] is not first
+
+
+class _NoScanDict(dict):
+    """Registered-tools dict that fails the test if it is iterated."""
+
+    def __iter__(self):
+        raise AssertionError("registered tools were scanned")
+
+    def items(self):
+        raise AssertionError("registered tools were scanned")
+
+
+@pytest.fixture(scope="class")
+def named_connector():
+    """One connector with three registered tools, shared by every case in a class."""
+    pytest.importorskip("langchain_core")
+    from vendor_connectors.base import VendorConnectorBase
+
+    connector = VendorConnectorBase(api_key="test", from_environment=False)
+    for name in ("alpha", "beta", "gamma"):
+        connector.register_tool(lookup, name=name)
+    return connector
+
+
+class TestGetToolsByName:
+    """Tests for VendorConnectorBase.get_tools(names=...)."""
+
+    def test_all_tools_without_names(self, named_connector):
+        """Test omitting names returns every tool in registration order."""
+        assert [tool.name for tool in named_connector.get_tools()] == ["alpha", "beta", "gamma"]
+
+    @pytest.mark.parametrize(
+        ("names", "expected"),
+        [
+            (["beta"], ["beta"]),
+            (["gamma", "alpha"], ["gamma", "alpha"]),
+            (["gamma", "missing", "alpha"], ["gamma", "alpha"]),
+            ([], []),
+        ],
+        ids=["single", "caller-order", "skips-unknown", "empty"],
+    )
+    def test_named_tools_are_looked_up(self, named_connector, names, expected):
+        """Test named tools are fetched by key rather than by scanning every tool."""
+        with patch.object(named_connector, "_tool_functions", _NoScanDict(named_connector._tool_functions)):
+            tools = named_connector.get_tools(names=names)
+
+        assert [tool.name for tool in tools] == expected
+
+    def test_names_may_be_a_one_shot_iterable(self, named_connector):
+        """Test names given as a generator are honoured in order."""
+        names = (name for name in ("beta", "alpha"))
+
+        assert [tool.name for tool in named_connector.get_tools(names=names)] == ["beta", "alpha"]
+
+
+class TestToolRegistrationThreadSafety:
+    """Tests for registering tools while other threads read them."""
+
+    def test_register_during_iteration(self):
+        """Test readers never see the tool dict change size mid-iteration."""
+        import threading
+
+        from vendor_connectors.base import VendorConnectorBase
+
+        connector = VendorConnectorBase(api_key="test", from_environment=False)
+        errors: list[Exception] = []
+        done = threading.Event()
+
+        def read() -> None:
+            while not done.is_set():
+                try:
+                    connector.get_ai_tool_definitions()
+                except Exception as e:
+                    errors.append(e)
+                    return
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        for i in range(500):
+            # A new function each time, so schema building isn't served from cache
+            def tool(value: str) -> str:
+                """Echo a value."""
+                return value
+
+            connector.register_tool(tool, name=f"tool_{i}")
+        done.set()
+        reader.join()
+
+        assert errors == []
+        assert len(connector.get_ai_tool_definitions()) == 500
+
+    def test_schema_built_before_reregistration_is_not_cached(self):
+        """Test a schema built from a stale snapshot is returned but not kept."""
+        from vendor_connectors.base import VendorConnectorBase
+
+        connector = VendorConnectorBase(api_key="test", from_environment=False)
+
+        connector.register_tool(lookup)
+        build = connector._build_input_schema
+
+        def build_then_reregister(name, func):
+            schema = build(name, func)
+            connector.register_tool(lookup, schema=LookupSchema)
+            return schema
+
+        connector._build_input_schema = build_then_reregister
+        stale = connector.get_ai_tool_definitions()[0]["inputSchema"]
+        del connector._build_input_schema
+
+        fresh = connector.get_ai_tool_definitions()[0]["inputSchema"]
+        assert "description" not in stale["properties"]["item_id"]
+        assert fresh["properties"]["item_id"]["description"] == "Item ID"
+
+
+class TestConcurrentToolCalls:
+    """Tests for VendorConnectorBase.ahandle_ai_tool_calls."""
+
+    def test_read_only_calls_overlap_and_writes_are_serial(self):
+        """Test read-only calls run together while mutating calls act as barriers."""
+        import asyncio
+        import threading
+
+        from vendor_connectors.base import VendorConnectorBase
+
+        connector = VendorConnectorBase(api_key="test", from_environment=False)
+        events: list[str] = []
+        both_reads_started = threading.Barrier(2, timeout=5)
+
+        def get_item(item_id: str) -> str:
+            """Read an item."""
+            both_reads_started.wait()
+            events.append(f"get:{item_id}")
+            return item_id
+
+        def create_item(item_id: str) -> str:
+            """Create an item."""
+            events.append(f"create:{item_id}")
+            return f"created {item_id}"
+
+        connector.register_tool(get_item)
+        connector.register_tool(create_item)
+
+        results = asyncio.run(
+            connector.ahandle_ai_tool_calls(
+                [
+                    ("get_item", {"item_id": "a"}),
+                    ("get_item", {"item_id": "b"}),
+                    ("create_item", {"item_id": "c"}),
+                ]
+            )
+        )
+
+        assert results == ["a", "b", "created c"]
+        assert sorted(events[:2]) == ["get:a", "get:b"]
+        assert events[2] == "create:c"
+
+    def test_thread_unsafe_connector_runs_calls_sequentially(self):
+        """Test connectors that opt out of thread sharing never overlap calls."""
+        import asyncio
+        import threading
+        import time
+
+        from vendor_connectors.base import VendorConnectorBase
+
+        class SingleThreadedConnector(VendorConnectorBase):
+            THREAD_SAFE_TOOLS = False
+
+        connector = SingleThreadedConnector(api_key="test", from_environment=False)
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def get_item(item_id: str) -> str:
+            """Read an item."""
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return item_id
+
+        connector.register_tool(get_item)
+
+        results = asyncio.run(connector.ahandle_ai_tool_calls([("get_item", {"item_id": str(i)}) for i in range(4)]))
+
+        assert results == ["0", "1", "2", "3"]
+        assert peak == 1
+
+    def test_google_connector_opts_out_of_thread_sharing(self):
+        """Test GoogleConnector, whose API services are not thread-safe, runs calls sequentially."""
+        from vendor_connectors.google import GoogleConnector
+
+        assert GoogleConnector.THREAD_SAFE_TOOLS is False
@@ -223,6 +223,260 @@ class TestAnthropicConnector:
             assert models[0].id == "claude-sonnet-4-20250514"
 
 
+class TestResponseCache:
+    """Tests for the opt-in create_message response cache."""
+
+    def _mock_client(self):
+        mock_client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.is_success = True
+        mock_response.json.return_value = {
+            "id": "msg_123",
+            "type": "message",
+            "role": "assistant",
+            "content": [{"type": "text", "text": "Hello!"}],
+            "model": "claude-sonnet-4-20250514",
+            "usage": {"input_tokens": 10, "output_tokens": 5},
+        }
+        mock_client.request.return_value = mock_response
+        return mock_client
+
+    def _send(self, connector, temperature=0, content="Hi"):
+        return connector.create_message(
+            model="claude-sonnet-4-20250514",
+            max_tokens=1024,
+            messages=[{"role": "user", "content": content}],
+            temperature=temperature,
+        )
+
+    def test_deterministic_requests_are_cached(self):
+        """Identical temperature=0 requests hit the API once."""
+        import httpx
+
+        mock_client = self._mock_client()
+        with patch.object(httpx, "Client", return_value=mock_client):
+            connector = AnthropicConnector(api_key="test-key", cache_ttl=60)
+            first = self._send(connector)
+            second = self._send(connector)
+            self._send(connector, content="Something else")
+
+        assert first.text == second.text == "Hello!"
+        assert first is not second
+        assert mock_client.request.call_count == 2
+
+    def test_normalized_prompts_share_cache_entry(self):
+        """With cache_normalize, case and whitespace variants hit the same entry."""
+        import httpx
+
+        mock_client = self._mock_client()
+        with patch.object(httpx, "Client", return_value=mock_client):
+            connector = AnthropicConnector(api_key="test-key", cache_ttl=60, cache_normalize=True)
+            self._send(connector, content="Hello  world!")
+            self._send(connector, content=" hello world! ")
+            self._send(connector, content=[{"type": "text", "text": "HELLO\nworld!"}])
+            self._send(connector, content=[{"type": "text", "text": "hello world!"}])
+
+        assert mock_client.request.call_count == 2
+
+    def test_prompts_are_exact_without_normalize(self):
+        """By default prompts must match exactly to share a cache entry."""
+        import httpx
+
+        mock_client = self._mock_client()
+        with patch.object(httpx, "Client", return_value=mock_client):
+            connector = AnthropicConnector(api_key="test-key", cache_ttl=60)
+            self._send(connector, content="Hello world!")
+            self._send(connector, content="hello world!")
+
+        assert mock_client.request.call_count == 2
+
+    def test_sampled_requests_are_not_cached(self):
+        """Requests with non-zero temperature always reach the API."""
+        import httpx
+
+        mock_client = self._mock_client()
+        with patch.object(httpx, "Client", return_value=mock_client):
+            connector = AnthropicConnector(api_key="test-key", cache_ttl=60)
+            self._send(connector, temperature=0.7)
+            self._send(connector, temperature=0.7)
+
+        assert mock_client.request.call_count == 2
+
+    def test_cache_disabled_by_default(self):
+        """Without cache_ttl every request reaches the API."""
+        import httpx
+
+        mock_client = self._mock_client()
+        with patch.object(httpx, "Client", return_value=mock_client):
+            connector = AnthropicConnector(api_key="test-key")
+            self._send(connector)
+            self._send(connector)
+
+        assert mock_client.request.call_count == 2
+
+    def test_expired_and_evicted_entries(self):
+        """Entries expire after cache_ttl and the oldest is evicted past cache_size."""
+        import httpx
+
+        mock_client = self._mock_client()
+        with patch.object(httpx, "Client", return_value=mock_client):
+            connector = AnthropicConnector(api_key="test-key", cache_ttl=60, cache_size=1)
+            with patch("vendor_connectors.anthropic.time.monotonic", return_value=0.0):
+                self._send(connector, content="a")
+                self._send(connector, content="b")
+                self._send(connector, content="a")
+            assert mock_client.request.call_count == 3
+
+            with patch("vendor_connectors.anthropic.time.monotonic", return_value=61.0):
+                self._send(connector, content="a")
+            assert mock_client.request.call_count == 4
+
+
+class TestStreamMessage:
+    """Tests for streaming messages with concurrent tool execution."""
+
+    def _sse(self, *events):
+        import json
+
+        lines = []
+        for event in events:
+            lines += [f"event: {event['type']}", f"data: {json.dumps(event)}", ""]
+        return lines
+
+    def _mock_client(self, lines, is_success=True):
+        mock_client = MagicMock()
+        mock_response = mock_client.stream.return_value.__enter__.return_value
+        mock_response.is_success = is_success
+        mock_response.iter_lines.return_value = iter(lines)
+        return mock_client
+
+    def _stream(self, connector, **kwargs):
+        return list(
+            connector.stream_message(
+                model="claude-sonnet-4-20250514",
+                max_tokens=1024,
+                messages=[{"role": "user", "content": "Hi"}],
+                **kwargs,
+            )
+        )
+
+    def test_streams_events(self):
+        """Events are yielded in order and pings are dropped."""
+        import httpx
+
+        lines = self._sse(
+            {"type": "message_start", "message": {"id": "msg_1"}},
+            {"type": "ping"},
+            {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "Hel"}},
+            {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "lo"}},
+            {"type": "message_stop"},
+        )
+        mock_client = self._mock_client(lines)
+        with patch.object(httpx, "Client", return_value=mock_client):
+            connector = AnthropicConnector(api_key="test-key")
+            events = self._stream(connector)
+
+        assert [e["type"] for e in events] == [
+            "message_start",
+            "content_block_delta",
+            "content_block_delta",
+            "message_stop",
+        ]
+        assert "".join(e["delta"]["text"] for e in events if e["type"] == "content_block_delta") == "Hello"
+        assert mock_client.stream.call_args.kwargs["json"]["stream"] is True
+
+    @pytest.mark.parametrize("max_tool_concurrency", [0, -1])
+    def test_rejects_non_positive_tool_concurrency(self, max_tool_concurrency):
+        """An invalid concurrency limit fails with a clear error before any request."""
+        import httpx
+
+        mock_client = self._mock_client([])
+        with patch.object(httpx, "Client", return_value=mock_client):
+            connector = AnthropicConnector(api_key="test-key")
+            with pytest.raises(ValueError, match="max_tool_concurrency"):
+                self._stream(
+                    connector, tool_handler=lambda name, arguments: None, max_tool_concurrency=max_tool_concurrency
+                )
+
+        mock_client.stream.assert_not_called()
+
+    def test_tool_runs_before_stream_ends(self):
+        """A finished tool_use block starts executing while tokens still stream."""
+        import threading
+
+        import httpx
+
+        tool_started = threading.Event()
+
+        def handler(name, arguments):
+            tool_started.set()
+            return f"{name}:{arguments['city']}"
+
+        def lines():
+            yield from self._sse(
+                {
+                    "type": "content_block_start",
+                    "index": 0,
+                    "content_block": {"type": "tool_use", "id": "tu_1", "name": "weather"},
+                },
+                {
+                    "type": "content_block_delta",
+                    "index": 0,
+                    "delta": {"type": "input_json_delta", "partial_json": '{"city": '},
+                },
+                {
+                    "type": "content_block_delta",
+                    "index": 0,
+                    "delta": {"type": "input_json_delta", "partial_json": '"Oslo"}'},
+                },
+                {"type": "content_block_stop", "index": 0},
+            )
+            assert tool_started.wait(timeout=5)
+            yield from self._sse({"type": "message_stop"})
+
+        mock_client = self._mock_client(lines())
+        with patch.object(httpx, "Client", return_value=mock_client):
+            connector = AnthropicConnector(api_key="test-key")
+            events = self._stream(connector, tool_handler=handler)
+
+        assert events[-1] == {"type": "tool_result", "tool_use_id": "tu_1", "content": "weather:Oslo"}
+
+    def test_tool_errors_become_error_results(self):
+        """A failing tool yields an is_error tool_result instead of raising."""
+        import httpx
+
+        def handler(name, arguments):
+            raise RuntimeError("boom")
+
+        lines = self._sse(
+            {
+                "type": "content_block_start",
+                "index": 0,
+                "content_block": {"type": "tool_use", "id": "tu_1", "name": "weather"},
+            },
+            {"type": "content_block_stop", "index": 0},
+            {"type": "message_stop"},
+        )
+        mock_client = self._mock_client(lines)
+        with patch.object(httpx, "Client", return_value=mock_client):
+            connector = AnthropicConnector(api_key="test-key")
+            events = self._stream(connector, tool_handler=handler)
+
+        assert events[-1] == {"type": "tool_result", "tool_use_id": "tu_1", "content": "boom", "is_error": True}
+
+    def test_error_event_raises(self):
+        """An error event in the stream raises AnthropicError."""
+        import httpx
+
+        lines = self._sse({"type": "error", "error": {"type": "overloaded_error", "message": "Overloaded"}})
+        mock_client = self._mock_client(lines)
+        with patch.object(httpx, "Client", return_value=mock_client):
+            connector = AnthropicConnector(api_key="test-key")
+            with pytest.raises(AnthropicError, match="Overloaded"):
+                self._stream(connector)
+
+
 class TestClaudeModels:
     """Tests for Claude model constants.
 
@@ -77,6 +77,32 @@ class TestS3BucketOperations:
 
         assert result == "us-east-1"
 
+    def test_bucket_exists(self, aws_connector):
+        """Test bucket existence check uses HeadBucket."""
+        mock_s3 = MagicMock()
+        aws_connector.get_aws_client = MagicMock(return_value=mock_s3)
+
+        assert aws_connector.bucket_exists("my-bucket") is True
+        mock_s3.head_bucket.assert_called_once_with(Bucket="my-bucket")
+        mock_s3.list_buckets.assert_not_called()
+
+    def test_bucket_exists_not_found(self, aws_connector):
+        """Test bucket existence check for a missing bucket."""
+        mock_s3 = MagicMock()
+        mock_s3.head_bucket.side_effect = ClientError({"Error": {"Code": "404"}}, "HeadBucket")
+        aws_connector.get_aws_client = MagicMock(return_value=mock_s3)
+
+        assert aws_connector.bucket_exists("missing-bucket") is False
+
+    def test_bucket_exists_other_error(self, aws_connector):
+        """Test bucket existence check re-raises non-404 errors."""
+        mock_s3 = MagicMock()
+        mock_s3.head_bucket.side_effect = ClientError({"Error": {"Code": "403"}}, "HeadBucket")
+        aws_connector.get_aws_client = MagicMock(return_value=mock_s3)
+
+        with pytest.raises(ClientError):
+            aws_connector.bucket_exists("my-bucket")
+
     def test_get_bucket_tags(self, aws_connector):
         """Test getting bucket tags."""
         mock_s3 = MagicMock()
@@ -400,16 +426,39 @@ class TestS3BucketFeatures:
 
     def test_get_bucket_features_no_bucket(self, aws_connector):
         """Test getting features for non-existent bucket."""
-        mock_bucket = MagicMock()
-        mock_bucket.creation_date = None
+        mock_s3 = MagicMock()
+        mock_s3.head_bucket.side_effect = ClientError({"Error": {"Code": "404"}}, "HeadBucket")
+        aws_connector.get_aws_client = MagicMock(return_value=mock_s3)
 
         mock_resource = MagicMock()
-        mock_resource.Bucket.return_value = mock_bucket
         aws_connector.get_aws_resource = MagicMock(return_value=mock_resource)
 
         result = aws_connector.get_bucket_features("missing-bucket")
 
         assert result == {}
+        mock_resource.Bucket.assert_not_called()
+
+    @pytest.mark.parametrize("code", ["403", "AccessDenied", "Forbidden"])
+    def test_get_bucket_features_inaccessible_bucket(self, aws_connector, code):
+        """Test features are empty, not an error, when HeadBucket is denied."""
+        mock_s3 = MagicMock()
+        mock_s3.head_bucket.side_effect = ClientError({"Error": {"Code": code}}, "HeadBucket")
+        aws_connector.get_aws_client = MagicMock(return_value=mock_s3)
+        aws_connector.get_aws_resource = MagicMock()
+
+        assert aws_connector.get_bucket_features("someone-elses-bucket") == {}
+        aws_connector.get_aws_resource.return_value.Bucket.assert_not_called()
+
+    @pytest.mark.parametrize("code", ["ExpiredToken", "InvalidAccessKeyId", "SlowDown"])
+    def test_get_bucket_features_other_head_errors_raise(self, aws_connector, code):
+        """Test credential and transient HeadBucket errors are not reported as missing features."""
+        mock_s3 = MagicMock()
+        mock_s3.head_bucket.side_effect = ClientError({"Error": {"Code": code}}, "HeadBucket")
+        aws_connector.get_aws_client = MagicMock(return_value=mock_s3)
+        aws_connector.get_aws_resource = MagicMock()
+
+        with pytest.raises(ClientError):
+            aws_connector.get_bucket_features("my-bucket")
 
     def test_get_bucket_features_errors(self, aws_connector):
         """Test getting bucket features with errors."""
@@ -0,0 +1,68 @@
+"""Tests for VendorConnectorBase."""
+
+from __future__ import annotations
+
+import gc
+import weakref
+from unittest.mock import patch
+
+import httpx
+
+from vendor_connectors.base import VendorConnectorBase
+
+
+class TestRateLimiting:
+    """Tests for per-connector-type request spacing."""
+
+    def _connector_class(self):
+        class SpacedConnector(VendorConnectorBase):
+            MIN_REQUEST_INTERVAL = 0.001
+
+        return SpacedConnector
+
+    def test_instances_of_a_type_share_one_lock(self):
+        """All instances of a connector type are spaced by the same lock."""
+        cls = self._connector_class()
+
+        cls(api_key="test", from_environment=False)._rate_limit()
+        lock = VendorConnectorBase._rate_limit_locks[cls]
+        cls(api_key="test", from_environment=False)._rate_limit()
+
+        assert VendorConnectorBase._rate_limit_locks[cls] is lock
+
+    def test_state_does_not_keep_connector_classes_alive(self):
+        """Rate-limit state is dropped once a connector class is collected."""
+        cls = self._connector_class()
+        cls(api_key="test", from_environment=False)._rate_limit()
+        cls_ref = weakref.ref(cls)
+
+        del cls
+        gc.collect()
+
+        assert cls_ref() is None
+
+
+class TestClient:
+    """Tests for the pooled HTTP client."""
+
+    @patch("vendor_connectors.base.httpx.Client")
+    def test_client_is_lazy_pooled_and_reused(self, mock_client_cls):
+        """The client is created on first use, with pool limits, and then reused."""
+        connector = VendorConnectorBase(api_key="test", from_environment=False)
+        mock_client_cls.assert_not_called()
+
+        assert connector.client is connector.client
+        mock_client_cls.assert_called_once_with(timeout=300.0, limits=VendorConnectorBase.CLIENT_LIMITS)
+
+    def test_download_uses_pooled_client(self, tmp_path):
+        """Downloads go through the connector's client rather than a one-off one."""
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=b"payload"))
+        connector = VendorConnectorBase(api_key="test", from_environment=False)
+        connector._client = httpx.Client(transport=transport)
+        output = tmp_path / "nested" / "file.bin"
+
+        size = connector.download("https://example.com/file.bin", str(output))
+        connector.close()
+
+        assert size == len(b"payload")
+        assert output.read_bytes() == b"payload"
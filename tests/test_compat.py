@@ -0,0 +1,88 @@
+"""Tests for vendor_connectors._compat helpers."""
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+
+from vendor_connectors import _compat
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+
+
+PAYLOAD = {
+    "success": True,
+    "data": [1, "a", None],
+    "when": datetime(2024, 1, 2, 3, 4, 5),
+    "day": date(2024, 1, 2),
+    "s": "café",
+    "color": Color.RED,
+    "point": Point(1),
+    7: "int key",
+}
+EXPECTED = (
+    '{"success":true,"data":[1,"a",null],"when":"2024-01-02T03:04:05","day":"2024-01-02",'
+    '"s":"café","color":"red","point":"Point(x=1)","7":"int key"}'
+)
+
+
+def _dumps(obj, use_orjson, **kwargs):
+    if use_orjson:
+        pytest.importorskip("orjson")
+        return _compat.dumps_compact(obj, **kwargs)
+    with patch.object(_compat, "orjson", None):
+        return _compat.dumps_compact(obj, **kwargs)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+def test_dumps_compact(use_orjson):
+    """Both backends emit the same compact text, with ISO dates and unescaped non-ASCII."""
+    assert _dumps(PAYLOAD, use_orjson) == EXPECTED
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+@pytest.mark.parametrize("value", [datetime(2024, 1, 2), Point(1), object()])
+def test_dumps_compact_strict_rejects_non_json(use_orjson, value):
+    """Strict mode raises TypeError for non-JSON values on both backends."""
+    with pytest.raises(TypeError):
+        _dumps({"value": value}, use_orjson, strict=True)
+
+
+@pytest.mark.parametrize(
+    ("package", "expected"),
+    [("json", True), ("xml.dom", True), ("no_such_package_xyz", False), ("no_such_package_xyz.sub", False)],
+)
+def test_is_available(package, expected):
+    """Installed packages, including dotted submodules, are found; missing ones are not."""
+    assert _compat.is_available(package) is expected
+
+
+def test_is_available_probes_once():
+    """Each package is import-probed once and the result is cached."""
+    _compat.is_available.cache_clear()
+    with patch("vendor_connectors._compat.importlib.import_module") as mock_import:
+        assert _compat.is_available("some_framework") is True
+        assert _compat.is_available("some_framework") is True
+
+    mock_import.assert_called_once_with("some_framework")
+    _compat.is_available.cache_clear()
+
+
+def test_is_available_false_for_broken_install():
+    """An installed package that fails to import is reported unavailable."""
+    _compat.is_available.cache_clear()
+    with patch("vendor_connectors._compat.importlib.import_module", side_effect=ImportError("incompatible pydantic")):
+        assert _compat.is_available("broken_framework") is False
+
+    _compat.is_available.cache_clear()
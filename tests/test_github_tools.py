@@ -353,6 +353,21 @@ class TestGetTools:
         assert len(tools) > 0
         assert all(callable(t) for t in tools)
 
+    def test_langchain_tools_built_once(self):
+        """Test LangChain argument schemas are built once and tools are copied per call."""
+        pytest.importorskip("langchain_core")
+        from vendor_connectors.github.tools import get_langchain_tools
+
+        first = get_langchain_tools()
+        second = get_langchain_tools()
+
+        assert all(a is not b for a, b in zip(first, second))
+        assert all(a.args_schema is b.args_schema for a, b in zip(first, second))
+
+        first[0].return_direct = True
+        assert second[0].return_direct is False
+        assert get_langchain_tools()[0].return_direct is False
+
     def test_get_tools_invalid_framework(self):
         """Test get_tools with invalid framework raises ValueError."""
         from vendor_connectors.github.tools import get_tools
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import json
 from unittest.mock import MagicMock, patch
 
+import vendor_connectors.google as google_module
 from vendor_connectors.google import GoogleConnector
 
 
@@ -96,8 +98,65 @@ class TestGoogleConnector:
         mock_from_sa.assert_called_once()
 
     @patch("vendor_connectors.google.service_account.Credentials.from_service_account_info")
-    @patch("vendor_connectors.google.build")
-    def test_get_service(self, mock_build, mock_from_sa, base_connector_kwargs):
+    def test_credentials_shared_across_instances(self, mock_from_sa, base_connector_kwargs):
+        """Test connectors with the same service account reuse parsed credentials."""
+        mock_from_sa.return_value = MagicMock()
+
+        first = GoogleConnector(service_account_info=_service_account(), **base_connector_kwargs)
+        second = GoogleConnector(service_account_info=json.dumps(_service_account()), **base_connector_kwargs)
+
+        assert first.credentials is second.credentials
+        mock_from_sa.assert_called_once()
+
+    @patch("vendor_connectors.google.service_account.Credentials.from_service_account_info")
+    def test_credentials_cache_keyed_by_subject(self, mock_from_sa, base_connector_kwargs):
+        """Test impersonated credentials are cached separately per subject."""
+        base_credentials = MagicMock()
+        mock_from_sa.return_value = base_credentials
+
+        connector = GoogleConnector(service_account_info=_service_account(), **base_connector_kwargs)
+        connector.get_credentials_for_subject("admin@example.com")
+        connector.get_credentials_for_subject("admin@example.com")
+        connector.get_credentials_for_subject("other@example.com")
+
+        assert mock_from_sa.call_count == 2
+        assert base_credentials.with_subject.call_count == 2
+
+    @patch("vendor_connectors.google.service_account.Credentials.from_service_account_info")
+    def test_credentials_cache_is_bounded(self, mock_from_sa, base_connector_kwargs):
+        """Test impersonating many users evicts the least recently used credentials."""
+        mock_from_sa.return_value = MagicMock()
+        connector = GoogleConnector(service_account_info=_service_account(), **base_connector_kwargs)
+
+        for i in range(google_module._CREDENTIALS_CACHE_SIZE + 3):
+            connector.get_credentials_for_subject(f"user{i}@example.com")
+
+        assert len(google_module._credentials_cache) == google_module._CREDENTIALS_CACHE_SIZE
+        calls = mock_from_sa.call_count
+        connector.get_credentials_for_subject("user0@example.com")
+        assert mock_from_sa.call_count == calls + 1
+
+    def test_project_id_from_service_account(self, base_connector_kwargs):
+        """Test project_id falls back to the service account project."""
+        connector = GoogleConnector(service_account_info=_service_account(), **base_connector_kwargs)
+
+        assert connector.project_id == "test-project"
+
+    def test_project_id_from_input(self, base_connector_kwargs):
+        """Test GOOGLE_PROJECT_ID input takes precedence."""
+        connector = GoogleConnector(
+            service_account_info=_service_account(),
+            inputs={"GOOGLE_PROJECT_ID": "override-project"},
+            **base_connector_kwargs,
+        )
+
+        assert connector.project_id == "override-project"
+
+    @patch.dict("vendor_connectors.google._discovery_docs", clear=True)
+    @patch("vendor_connectors.google.service_account.Credentials.from_service_account_info")
+    @patch("vendor_connectors.google.discovery_cache.get_static_doc", return_value='{"name": "admin"}')
+    @patch("vendor_connectors.google.build_from_document")
+    def test_get_service(self, mock_build, mock_get_doc, mock_from_sa, base_connector_kwargs):
         """Test getting a Google service."""
         service_account = _service_account()
 
@@ -113,11 +172,14 @@ class TestGoogleConnector:
 
         service = connector.get_service("admin", "directory_v1")
         assert service == mock_service
-        mock_build.assert_called_once_with("admin", "directory_v1", credentials=mock_credentials)
+        mock_get_doc.assert_called_once_with("admin", "directory_v1")
+        mock_build.assert_called_once_with('{"name": "admin"}', credentials=mock_credentials)
 
+    @patch.dict("vendor_connectors.google._discovery_docs", clear=True)
     @patch("vendor_connectors.google.service_account.Credentials.from_service_account_info")
-    @patch("vendor_connectors.google.build")
-    def test_get_service_caching(self, mock_build, mock_from_sa, base_connector_kwargs):
+    @patch("vendor_connectors.google.discovery_cache.get_static_doc", return_value='{"name": "admin"}')
+    @patch("vendor_connectors.google.build_from_document")
+    def test_get_service_caching(self, mock_build, mock_get_doc, mock_from_sa, base_connector_kwargs):
         """Test that services are cached."""
         service_account = _service_account()
 
@@ -139,6 +201,41 @@ class TestGoogleConnector:
         assert mock_build.call_count == 1
         assert service1 is service2
 
+    @patch.dict("vendor_connectors.google._discovery_docs", clear=True)
+    @patch("vendor_connectors.google.service_account.Credentials.from_service_account_info")
+    @patch("vendor_connectors.google.discovery_cache.get_static_doc", return_value='{"name": "admin"}')
+    @patch("vendor_connectors.google.build_from_document")
+    def test_discovery_document_shared_across_instances(
+        self, mock_build, mock_get_doc, mock_from_sa, base_connector_kwargs
+    ):
+        """Test the discovery document is loaded once for all connectors."""
+        mock_from_sa.return_value = MagicMock()
+        mock_build.side_effect = lambda *_, **__: MagicMock()
+
+        first = GoogleConnector(service_account_info=_service_account(), **base_connector_kwargs)
+        second = GoogleConnector(service_account_info=_service_account(), **base_connector_kwargs)
+
+        service1 = first.get_service("admin", "directory_v1")
+        service2 = second.get_service("admin", "directory_v1")
+
+        mock_get_doc.assert_called_once_with("admin", "directory_v1")
+        assert mock_build.call_count == 2
+        assert service1 is not service2
+
+    @patch.dict("vendor_connectors.google._discovery_docs", clear=True)
+    @patch("vendor_connectors.google.service_account.Credentials.from_service_account_info")
+    @patch("vendor_connectors.google.discovery_cache.get_static_doc", return_value=None)
+    @patch("vendor_connectors.google.build")
+    def test_get_service_without_static_document(self, mock_build, mock_get_doc, mock_from_sa, base_connector_kwargs):
+        """Test APIs without a bundled discovery document fall back to build()."""
+        mock_credentials = MagicMock()
+        mock_from_sa.return_value = mock_credentials
+
+        connector = GoogleConnector(service_account_info=_service_account(), **base_connector_kwargs)
+        connector.get_service("custom", "v1")
+
+        mock_build.assert_called_once_with("custom", "v1", credentials=mock_credentials)
+
     @patch.object(GoogleConnector, "get_admin_directory_service")
     def test_list_users_filters_and_transforms(self, mock_get_service, base_connector_kwargs):
         """Ensure list_users applies filtering, flattening, and keying."""
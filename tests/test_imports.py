@@ -0,0 +1,44 @@
+"""Import-time behaviour of the top-level vendor_connectors package."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import vendor_connectors
+
+
+def test_import_does_not_load_optional_sdks():
+    """Importing the package leaves optional vendor SDKs unloaded."""
+    code = (
+        "import sys, vendor_connectors; "
+        "print(','.join(m for m in ('boto3', 'github', 'slack_sdk', 'hvac', 'googleapiclient') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == ""
+
+
+def test_lazy_connector_resolves_on_access():
+    """Optional connectors resolve to their class on first access."""
+    from vendor_connectors.aws import AWSConnector
+
+    assert vendor_connectors.AWSConnector is AWSConnector
+    assert "AWSConnector" in dir(vendor_connectors)
+
+
+def test_all_submodules_import():
+    """Every submodule parses and imports; only missing optional extras are tolerated."""
+    import importlib
+    import pkgutil
+
+    failures = []
+    for module in pkgutil.walk_packages(vendor_connectors.__path__, prefix="vendor_connectors."):
+        try:
+            importlib.import_module(module.name)
+        except ImportError:
+            continue  # Optional extra not installed
+        except Exception as e:  # SyntaxError from conflict markers, NameError, etc.
+            failures.append(f"{module.name}: {type(e).__name__}: {e}")
+
+    assert failures == []
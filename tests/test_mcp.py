@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from vendor_connectors.mcp import create_server
+import threading
+from unittest.mock import patch
+
+from vendor_connectors.mcp import _thread_local_handlers, create_server
 
 
 def test_create_server():
@@ -11,3 +14,46 @@ def test_create_server():
     assert server.name == "vendor-connectors"
     # Basic check that server was initialized
     assert server is not None
+
+
+class _FakeConnector:
+    def list_items(self):
+        return []
+
+    def get_item(self):
+        return None
+
+
+class TestThreadLocalHandlers:
+    """Tests for resolving tool handlers per worker thread."""
+
+    TOOLS = {
+        "fake_list_items": {"connector": "fake", "method": "list_items"},
+        "fake_get_item": {"connector": "fake", "method": "get_item"},
+    }
+
+    def test_connector_shared_by_tools_within_a_thread(self):
+        """Tools of one connector share an instance and bound methods are cached."""
+        get_handler = _thread_local_handlers(self.TOOLS)
+
+        with patch("vendor_connectors.mcp.get_connector", side_effect=lambda name: _FakeConnector()) as mock_get:
+            first = get_handler("fake_list_items")
+            assert get_handler("fake_list_items") is first
+            other = get_handler("fake_get_item")
+
+        mock_get.assert_called_once_with("fake")
+        assert first.__self__ is other.__self__
+
+    def test_each_thread_gets_its_own_connector(self):
+        """Connectors are not shared across worker threads."""
+        get_handler = _thread_local_handlers(self.TOOLS)
+        handlers = []
+
+        with patch("vendor_connectors.mcp.get_connector", side_effect=lambda name: _FakeConnector()) as mock_get:
+            handlers.append(get_handler("fake_list_items"))
+            worker = threading.Thread(target=lambda: handlers.append(get_handler("fake_list_items")))
+            worker.start()
+            worker.join()
+
+        assert mock_get.call_count == 2
+        assert handlers[0].__self__ is not handlers[1].__self__
@@ -0,0 +1,152 @@
+"""Tests for vendor_connectors.registry connector discovery."""
+
+from __future__ import annotations
+
+import functools
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from vendor_connectors import registry
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry():
+    """Give each test empty connector caches, leaving the shared ones untouched."""
+    resolve = functools.cache(registry._resolve_connector.__wrapped__)
+    with (
+        patch.object(registry, "_connector_cache", None),
+        patch.object(registry, "_resolve_connector", resolve),
+    ):
+        yield
+
+
+class FakeConnector:
+    """Stand-in connector class."""
+
+
+@patch("vendor_connectors.registry._load_connectors", return_value={"fake": FakeConnector})
+def test_discovery_runs_once_across_threads(mock_load):
+    """Concurrent first listings share a single discovery pass."""
+    barrier = threading.Barrier(8)
+    results = []
+
+    def lookup():
+        barrier.wait()
+        results.append(registry.list_connectors()["fake"])
+
+    threads = [threading.Thread(target=lookup) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [FakeConnector] * 8
+    mock_load.assert_called_once_with()
+
+
+@patch("vendor_connectors.registry._load_connectors", return_value={"fake": FakeConnector})
+def test_list_connectors_returns_copy(_mock_load):
+    """Callers cannot mutate the shared snapshot."""
+    listed = registry.list_connectors()
+    listed["other"] = FakeConnector
+
+    assert "other" not in registry.list_connectors()
+
+
+@patch("vendor_connectors.registry._load_connectors", return_value={"fake": FakeConnector})
+def test_connectors_view_is_read_only_and_uncopied(mock_load):
+    """The view exposes the shared snapshot without allowing writes."""
+    view = registry.get_connectors_view()
+
+    assert view["fake"] is FakeConnector
+    with pytest.raises(TypeError):
+        view["other"] = FakeConnector
+    assert registry.get_connectors_view() == view
+    mock_load.assert_called_once_with()
+
+
+@patch("vendor_connectors.registry._load_connectors", return_value={"fake": FakeConnector})
+def test_clear_cache_forces_rediscovery(mock_load):
+    """clear_cache() drops the snapshot so the next listing discovers again."""
+    registry.list_connectors()
+    registry.clear_cache()
+    registry.list_connectors()
+
+    assert mock_load.call_count == 2
+
+
+@patch("vendor_connectors.registry._load_connectors", return_value={})
+def test_unknown_connector_raises(_mock_load):
+    """Unknown names raise ValueError."""
+    with pytest.raises(ValueError, match="Unknown connector"):
+        registry.get_connector_class("missing")
+
+
+@patch("vendor_connectors.registry._load_connectors", return_value={})
+@patch("vendor_connectors.registry._connector_entry_points", return_value=[])
+def test_unknown_names_are_not_cached(_mock_eps, _mock_load):
+    """Failed lookups leave the resolver cache empty so arbitrary names can't grow it."""
+    for name in ("missing", "also-missing"):
+        with pytest.raises(ValueError, match="Unknown connector"):
+            registry.get_connector_class(name)
+        # Drop the listing built for the error message so the next lookup resolves again
+        registry._connector_cache = None
+
+    assert registry._resolve_connector.cache_info().misses == 2
+    assert registry._resolve_connector.cache_info().currsize == 0
+
+
+@patch("vendor_connectors.registry._load_connectors")
+@patch("vendor_connectors.registry._connector_entry_points", return_value=[])
+@patch("vendor_connectors.registry._import_builtin", return_value=FakeConnector)
+def test_lookup_imports_only_requested_connector(mock_import, _mock_eps, mock_load):
+    """A single lookup imports one connector, once, without full discovery."""
+    assert registry.get_connector_class("Fake") is FakeConnector
+    assert registry.get_connector_class("fake") is FakeConnector
+
+    mock_import.assert_called_once_with("fake")
+    mock_load.assert_not_called()
+
+
+@patch("vendor_connectors.registry._import_builtin")
+@patch("vendor_connectors.registry._connector_entry_points")
+def test_entry_point_takes_precedence(mock_eps, mock_import):
+    """Entry points win over built-ins for single lookups too."""
+    ep = MagicMock()
+    ep.name = "fake"
+    ep.load.return_value = FakeConnector
+    mock_eps.return_value = [ep]
+
+    assert registry.get_connector_class("fake") is FakeConnector
+    mock_import.assert_not_called()
+
+
+@patch("vendor_connectors.registry._import_builtin", return_value=FakeConnector)
+@patch("vendor_connectors.registry._connector_entry_points", return_value=[])
+def test_preload_connectors(_mock_eps, mock_import):
+    """Preloading warms the lookup cache."""
+    registry.preload_connectors(["fake"])
+    registry.get_connector_class("fake")
+
+    mock_import.assert_called_once_with("fake")
+
+
+@pytest.mark.parametrize("error", [ImportError("missing extra"), AttributeError("sdk mismatch")])
+@patch("vendor_connectors.registry._connector_entry_points", return_value=[])
+def test_broken_builtin_is_skipped(_mock_eps, error):
+    """A built-in connector that fails to import is skipped, not fatal to discovery."""
+    real_import = registry.importlib.import_module
+
+    def import_module(name, *args, **kwargs):
+        if name == "vendor_connectors.zoom":
+            raise error
+        return real_import(name, *args, **kwargs)
+
+    with patch.object(registry.importlib, "import_module", side_effect=import_module):
+        with pytest.raises(ValueError, match="Unknown connector: zoom"):
+            registry.get_connector_class("zoom")
+        connectors = registry.list_connectors()
+
+    assert "zoom" not in connectors